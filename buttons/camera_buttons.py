@@ -1,5 +1,4 @@
 import customtkinter as ctk
-import threading
 from datetime import datetime
 from tkinter import messagebox
 import logging
@@ -153,6 +152,7 @@ class CameraButtons:
             
             # Refresh camera list
             self.app.camera_manager.refresh_camera_list()
+            self.app.available_cameras = self.app.camera_manager.get_available_cameras()
             
             # Update dropdown
             new_camera_list = self.app.camera_manager.get_camera_list_for_dropdown()
@@ -200,9 +200,7 @@ class CameraButtons:
             message = f"✅ [{timestamp}] Camera đã được mở thành công!\n🔍 Đang tìm kiếm mã QR code...\n📱 Đưa CCCD có mã QR vào khung hình\n🗄️ Database search sẵn sàng!\n📹 Camera: {camera_info}"
             self.app._update_content_log(message, append=True)
             
-            self.app.stop_video_event.clear()
-            self.app.video_thread = threading.Thread(target=self.app._video_loop, daemon=True)
-            self.app.video_thread.start()
+            self.app._start_video_threads()
             
         except Exception as e:
             logger.error(f"Failed to start camera: {e}")
@@ -263,8 +261,7 @@ class CameraButtons:
         self.app.scanning = False
         self.app.stop_video_event.set()
         
-        if self.app.video_thread and self.app.video_thread.is_alive():
-            self.app.video_thread.join(timeout=1.0)
+        self.app._join_video_threads(timeout=1.0)
         
         self.app.camera_manager.stop()
         self.update_scan_ui_state(False)
@@ -358,11 +355,12 @@ class CameraButtons:
     def unlock_qr_scan(self):
         """Unlock QR scanning to allow new QR detection"""
         self.app.qr_locked = False
-        self.app.detected_qrs.clear()  # Clear previous QR data
+        self.app._qr_generation += 1  # Discard any lookup still in flight
+        with self.app.qr_lock:
+            self.app.detected_qrs.clear()  # Clear previous QR data
         
         # Reset data display
-        for field in self.app.data_labels:
-            self.app.data_labels[field].configure(text="Chưa có dữ liệu")
+        self.app._clear_id_info()
         
         # Reset images
         self.app.front_image = None
@@ -376,6 +374,7 @@ class CameraButtons:
         # Update button states
         self.app.rescan_btn.configure(state="disabled")
         self.app.current_id_info = None
+        self.app.current_qr_content = None
         self.app._check_complete_status()  # This will disable save button if needed
         
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -1,5 +1,4 @@
 import customtkinter as ctk
-import numpy as np
 from datetime import datetime
 from tkinter import messagebox
 import logging
@@ -58,9 +57,9 @@ class CaptureButtons:
     
     def capture_front(self):
         """Capture front image of CCCD"""
-        if self.app.current_frame is not None and isinstance(self.app.current_frame, np.ndarray) and self.app.current_frame.size > 0:
-            self.app.front_image = self.app.current_frame.copy()
-            
+        frame = self.app.snapshot_current_frame()
+        if frame is not None:
+            self.app.front_image = frame
             timestamp = datetime.now().strftime("%H:%M:%S")
             message = f"📸 [{timestamp}] Đã chụp mặt trước CCCD!"
             self.app._update_content_log(message, append=True)
@@ -72,9 +71,9 @@ class CaptureButtons:
     
     def capture_back(self):
         """Capture back image of CCCD"""
-        if self.app.current_frame is not None and isinstance(self.app.current_frame, np.ndarray) and self.app.current_frame.size > 0:
-            self.app.back_image = self.app.current_frame.copy()
-            
+        frame = self.app.snapshot_current_frame()
+        if frame is not None:
+            self.app.back_image = frame
             timestamp = datetime.now().strftime("%H:%M:%S")
             message = f"📸 [{timestamp}] Đã chụp mặt sau CCCD!"
             self.app._update_content_log(message, append=True)
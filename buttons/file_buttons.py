@@ -46,10 +46,7 @@ class FileButtons:
         """Open Word documents folder"""
         try:
             folder_path = os.path.abspath(self.app.config.OUTPUT_DIR)
-            if os.name == 'nt':
-                os.startfile(folder_path)
-            elif os.name == 'posix':
-                os.system(f'open "{folder_path}"')
+            FileManager.open_folder(folder_path)
             
             stats = FileManager.get_folder_stats(folder_path)
             timestamp = datetime.now().strftime("%H:%M:%S")
@@ -64,10 +61,7 @@ class FileButtons:
         try:
             folder_path = os.path.abspath(self.app.config.SCAN_DIR)
             
-            if os.name == 'nt':
-                os.startfile(folder_path)
-            elif os.name == 'posix':
-                os.system(f'open "{folder_path}"')
+            FileManager.open_folder(folder_path)
             
             stats = FileManager.get_folder_stats(folder_path)
             timestamp = datetime.now().strftime("%H:%M:%S")
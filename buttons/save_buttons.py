@@ -3,7 +3,6 @@ import numpy as np
 import os
 from datetime import datetime
 from tkinter import messagebox
-from core.document_generator import DocumentGenerator
 import logging
 
 logger = logging.getLogger(__name__)
@@ -69,7 +68,7 @@ class SaveButtons:
                 messagebox.showerror("Lỗi", f"Lỗi kiểm tra ảnh: {str(e)}")
                 return
             
-            qr_content = list(self.app.detected_qrs)[-1] if self.app.detected_qrs else "N/A"
+            qr_content = self.app.current_qr_content or "N/A"
             
             # Check if we need to overwrite
             overwrite = hasattr(self.app, '_existing_file_to_overwrite') and self.app._existing_file_to_overwrite is not None
@@ -78,7 +77,9 @@ class SaveButtons:
             timestamp = datetime.now().strftime("%H:%M:%S")
             self.app._update_content_log(f"💾 [{timestamp}] Đang lưu tài liệu...", append=True)
             
-            # Create document (always creates new files)
+            # Create document (always creates new files) - python-docx is only
+            # imported on the first save, not at application startup
+            from core.document_generator import DocumentGenerator
             filename, old_files_to_delete = DocumentGenerator.create_complete_document(
                 self.app.current_id_info,
                 self.app.front_image,
@@ -61,16 +61,18 @@ class UtilityButtons:
         """Reset all data and UI"""
         # Reset QR detection
         self.app.qr_locked = False
-        self.app.detected_qrs.clear()
+        self.app._qr_generation += 1  # Discard any lookup still in flight
+        with self.app.qr_lock:
+            self.app.detected_qrs.clear()
         self.app.current_id_info = None
+        self.app.current_qr_content = None
         
         # Reset images
         self.app.front_image = None
         self.app.back_image = None
         
         # Reset data display
-        for field in self.app.data_labels:
-            self.app.data_labels[field].configure(text="Chưa có dữ liệu")
+        self.app._clear_id_info()
         
         # Reset capture buttons
         if self.app.scanning:  # Chỉ enable khi camera đang bật
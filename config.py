@@ -22,6 +22,16 @@ class Config:
     SCAN_DIR = os.path.join(BASE_DIR, "CCCD_Images")       # File ảnh và JSON
     
     MAX_FPS = 30
+    DISPLAY_MAX_FPS = 30             # Camera preview redraw cap
+    PREVIEW_USE_CUDA = False         # Resize the preview on an NVIDIA GPU when OpenCV has CUDA
+    PREVIEW_USE_OPENCL = False       # Resize + RGBA-convert the preview through OpenCL (UMat)
     QR_DETECTION_INTERVAL = 0.1
+    QR_DETECTION_MAX_DIM = 640  # Longest side of the frame passed to the QR decoder
+    QR_HISTORY_SIZE = 64        # Distinct QR payloads remembered to suppress re-processing
+    QR_DETECTION_EVERY_N_FRAMES = 3  # Run the QR decoder on every Nth frame at most
+    QR_MOTION_THRESHOLD = 3.0        # Mean abs diff (0-255) of an 80x45 thumbnail that counts as motion
+    QR_RESCAN_INTERVAL = 1.0         # Seconds before a still scene is scanned again
+    LOG_MAX_LINES = 10000            # Activity log is trimmed to its last N lines
+    LOG_FLUSH_INTERVAL_MS = 100      # Activity log writes are coalesced and flushed at most this often
     APP_TITLE = "🇻🇳 AGRIBANK ID Scanner - Professional UI with Search"
     VERSION = "4.0.0"
\ No newline at end of file
@@ -17,6 +17,7 @@ class CameraManager:
         self.is_active = False
         self.camera_index = 0
         self.available_cameras: Dict[int, str] = {}
+        self._working_backends: Dict[int, int] = {}  # Camera index -> backend that opened it
         self._scan_available_cameras()
         
     def _scan_available_cameras(self):
@@ -91,6 +92,7 @@ class CameraManager:
     def refresh_camera_list(self):
         """Refresh the list of available cameras"""
         logger.info("Refreshing camera list...")
+        self._working_backends.clear()
         self._scan_available_cameras()
         
     @contextmanager
@@ -102,7 +104,12 @@ class CameraManager:
             self.stop()
     
     def test_camera_backends(self) -> Optional[int]:
-        """Test different camera backends to find working one"""
+        """Test different camera backends to find working one - remembered per camera index"""
+        # Probing opens the device once per backend, so reuse the last result
+        cached = self._working_backends.get(self.camera_index)
+        if cached is not None:
+            return cached
+        
         backends = [
             cv2.CAP_DSHOW,     # DirectShow (Windows)
             cv2.CAP_MSMF,      # Microsoft Media Foundation (Windows 10+)
@@ -120,6 +127,7 @@ class CameraManager:
                     test_cap.release()
                     if ret and frame is not None:
                         logger.info(f"Camera backend {backend} works!")
+                        self._working_backends[self.camera_index] = backend
                         return backend
             except Exception as e:
                 logger.warning(f"Backend {backend} failed: {e}")
@@ -160,6 +168,9 @@ class CameraManager:
                 self.cap = cv2.VideoCapture(self.camera_index)
             
             if not self.cap.isOpened():
+                # The remembered backend no longer works for this camera
+                self._working_backends.pop(self.camera_index, None)
+                
                 # Method 3: Try finding available camera
                 available_index = self.find_available_camera()
                 if available_index is not None:
@@ -178,6 +189,8 @@ class CameraManager:
             if not ret or frame is None:
                 logger.error("Camera opened but cannot read frames")
                 self.cap.release()
+                # Probe the backends again next time instead of reusing this one
+                self._working_backends.pop(self.camera_index, None)
                 return False
                 
             self.is_active = True
@@ -218,7 +231,7 @@ class CameraManager:
             logger.info("Camera stopped")
     
     def read_frame(self) -> Optional[np.ndarray]:
-        """Read frame with error handling"""
+        """Read frame with error handling - each frame is a new array owned by the caller"""
         if not self.is_active or not self.cap:
             return None
             
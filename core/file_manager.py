@@ -2,6 +2,8 @@ import os
 import json
 import glob
 import re
+import subprocess
+import sys
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 from config import Config
@@ -125,4 +127,18 @@ class FileManager:
         except Exception as e:
             logger.error(f"Error getting folder stats: {e}")
         
-        return stats
\ No newline at end of file
+        return stats
+    
+    @staticmethod
+    def open_folder(folder_path: str):
+        """Open a folder in the system file browser without blocking"""
+        if os.name == 'nt':
+            os.startfile(folder_path)
+        else:
+            # Launch the opener directly - no shell, returns immediately
+            opener = 'xdg-open' if sys.platform.startswith('linux') else 'open'
+            subprocess.Popen(
+                [opener, folder_path],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
\ No newline at end of file
@@ -61,6 +61,12 @@ class IDDataParser:
             
         return id_info
     
+    @staticmethod
+    def parse_date(date_str: str) -> datetime:
+        """Parse a DD/MM/YYYY date by splitting - much cheaper than strptime, raises ValueError"""
+        day, month, year = date_str.split('/')
+        return datetime(int(year), int(month), int(day))
+    
     @staticmethod
     def _format_date(date_str: str) -> str:
         """Enhanced date formatting with multiple format support"""
@@ -68,10 +74,11 @@ class IDDataParser:
             clean_date = re.sub(r'[^\d]', '', date_str.strip())
             
             if len(clean_date) == 8:
-                # Try different date formats
-                for fmt in ['%d%m%Y', '%Y%m%d']:
+                # Try DDMMYYYY then YYYYMMDD - the datetime constructor validates
+                for year, month, day in ((clean_date[4:], clean_date[2:4], clean_date[:2]),
+                                         (clean_date[:4], clean_date[4:6], clean_date[6:])):
                     try:
-                        date_obj = datetime.strptime(clean_date, fmt)
+                        date_obj = datetime(int(year), int(month), int(day))
                         return date_obj.strftime('%d/%m/%Y')
                     except ValueError:
                         continue
@@ -84,8 +91,8 @@ class IDDataParser:
     def _calculate_expiry_date(birth_date_str: str, issue_date_str: str) -> str:
         """Calculate CCCD expiry date according to Vietnamese law"""
         try:
-            birth_date = datetime.strptime(birth_date_str, "%d/%m/%Y")
-            issue_date = datetime.strptime(issue_date_str, "%d/%m/%Y")
+            birth_date = IDDataParser.parse_date(birth_date_str)
+            issue_date = IDDataParser.parse_date(issue_date_str)
             
             # Calculate age at issue
             age_at_issue = (issue_date - birth_date).days // 365
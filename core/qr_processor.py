@@ -1,5 +1,6 @@
 import cv2
 import numpy as np
+from typing import Optional, Dict, Tuple
 from pyzbar import pyzbar
 import logging
 
@@ -8,12 +9,36 @@ logger = logging.getLogger(__name__)
 class QRProcessor:
     """Advanced QR code processing with multi-scale detection and full frame guidance"""
     
+    # Pre-rendered guidance layers keyed by (height, width, is_low_light, rgb): (rows, cols, colors)
+    _guidance_cache: Dict[Tuple[int, int, bool, bool], Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+    
     @staticmethod
-    def detect_qr_codes(frame: np.ndarray) -> list:
-        """Enhanced QR detection with multiple preprocessing strategies including low-light"""
-        # Convert to grayscale
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    def detect_qr_codes(frame: np.ndarray, max_dim: int = 0) -> list:
+        """Detect QR codes in a BGR or grayscale frame, optionally downscaled to max_dim"""
+        # zbar only needs luma - convert once, before any resize
+        gray = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        
+        height, width = gray.shape[:2]
+        if max_dim and max(height, width) > max_dim:
+            scale = max_dim / max(height, width)
+            small = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            
+            # Map detected coordinates back to the full-resolution frame
+            return [QRProcessor._scale_barcode(barcode, 1.0 / scale)
+                    for barcode in QRProcessor._decode_with_strategies(small)]
         
+        return QRProcessor._decode_with_strategies(gray)
+    
+    @staticmethod
+    def _scale_barcode(barcode, factor: float):
+        """Return a copy of a pyzbar result with rect and polygon scaled by factor"""
+        rect = type(barcode.rect)(*(int(round(v * factor)) for v in barcode.rect))
+        polygon = [type(point)(*(int(round(v * factor)) for v in point)) for point in barcode.polygon]
+        return barcode._replace(rect=rect, polygon=polygon)
+    
+    @staticmethod
+    def _decode_with_strategies(gray: np.ndarray) -> list:
+        """Enhanced QR detection on a grayscale image with multiple preprocessing strategies including low-light"""
         # Check if image is dark and needs low-light enhancement
         mean_brightness = np.mean(gray)
         is_low_light = mean_brightness < 80
@@ -97,14 +122,15 @@ class QRProcessor:
         return bilateral
     
     @staticmethod
-    def draw_detection(frame: np.ndarray, barcode) -> np.ndarray:
-        """Draw detection rectangle with guidance overlay"""
+    def draw_detection(frame: np.ndarray, barcode, rgb: bool = False) -> np.ndarray:
+        """Draw detection rectangle with guidance overlay (frame is BGR unless rgb=True)"""
         (x, y, w, h) = barcode.rect
+        accent = (243, 255, 0) if rgb else (0, 255, 243)
         
         # Draw with bright neon green accent for visibility
-        cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 243), 4)
+        cv2.rectangle(frame, (x, y), (x + w, y + h), accent, 4)
         cv2.putText(frame, "QR DETECTED!", (x, y - 15), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 243), 3)
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, accent, 3)
         
         # Add success indicator
         cv2.circle(frame, (x + w//2, y + h//2), 15, (0, 255, 0), -1)
@@ -114,18 +140,50 @@ class QRProcessor:
         return frame
     
     @staticmethod
-    def draw_guidance_overlay(frame: np.ndarray) -> np.ndarray:
-        """Draw guidance overlay optimized for full frame view"""
+    def draw_guidance_overlay(frame: np.ndarray, gray: Optional[np.ndarray] = None,
+                              rgb: bool = False) -> np.ndarray:
+        """Draw guidance overlay optimized for full frame view (frame is BGR unless rgb=True)"""
         height, width = frame.shape[:2]
         
-        # Check lighting condition
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        # Check lighting condition, reusing the caller's grayscale frame if given
+        if gray is None:
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
         mean_brightness = np.mean(gray)
         is_low_light = mean_brightness < 80
         
+        # Static guidance is rendered once per (size, lighting); only the drawn
+        # pixels are stored, so each frame writes just those instead of masking the whole frame
+        key = (height, width, is_low_light, rgb)
+        layer = QRProcessor._guidance_cache.get(key)
+        if layer is None:
+            canvas = np.zeros(frame.shape, dtype=np.uint8)
+            QRProcessor._render_guidance(canvas, is_low_light)
+            if rgb:
+                canvas = canvas[..., ::-1]
+            rows, cols = np.nonzero(canvas.any(axis=2))
+            layer = (rows, cols, canvas[rows, cols])
+            QRProcessor._guidance_cache[key] = layer
+        
+        rows, cols, colors = layer
+        frame[rows, cols] = colors
+        
+        # Add brightness indicator
+        brightness_text = f"Brightness: {int(mean_brightness)}"
+        cv2.putText(frame, brightness_text, (width - 200, height - 40), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+        
+        return frame
+    
+    @staticmethod
+    def _render_guidance(canvas: np.ndarray, is_low_light: bool):
+        """Draw the static part of the guidance overlay onto a blank canvas"""
+        # Every stroke is pinned to LINE_8: the canvas is blitted by its non-black pixels,
+        # so antialiased (LINE_AA) edges would paste as dark specks
+        height, width = canvas.shape[:2]
+        
         # Frame info overlay - show full frame size
-        cv2.putText(frame, f"Full Frame: {width}x{height}", (10, height - 10), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+        cv2.putText(canvas, f"Full Frame: {width}x{height}", (10, height - 10), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2, lineType=cv2.LINE_8)
         
         # Draw center focus area - larger for full frame
         center_x, center_y = width // 2, height // 2
@@ -135,10 +193,10 @@ class QRProcessor:
         color = (255, 255, 0) if not is_low_light else (0, 255, 255)  # Yellow for normal, Cyan for low light
         
         # Draw main focus rectangle
-        cv2.rectangle(frame, 
+        cv2.rectangle(canvas, 
                      (center_x - focus_size//2, center_y - focus_size//2),
                      (center_x + focus_size//2, center_y + focus_size//2),
-                     color, 2)
+                     color, 2, lineType=cv2.LINE_8)
         
         # Corner markers - larger for full frame
         corner_size = 30
@@ -151,18 +209,18 @@ class QRProcessor:
         
         for corner_x, corner_y in corners:
             # L-shaped corner markers
-            cv2.line(frame, (corner_x - corner_size, corner_y), 
-                    (corner_x - 8, corner_y), color, 4)
-            cv2.line(frame, (corner_x, corner_y - corner_size), 
-                    (corner_x, corner_y - 8), color, 4)
-            cv2.line(frame, (corner_x + corner_size, corner_y), 
-                    (corner_x + 8, corner_y), color, 4)
-            cv2.line(frame, (corner_x, corner_y + corner_size), 
-                    (corner_x, corner_y + 8), color, 4)
+            cv2.line(canvas, (corner_x - corner_size, corner_y), 
+                    (corner_x - 8, corner_y), color, 4, lineType=cv2.LINE_8)
+            cv2.line(canvas, (corner_x, corner_y - corner_size), 
+                    (corner_x, corner_y - 8), color, 4, lineType=cv2.LINE_8)
+            cv2.line(canvas, (corner_x + corner_size, corner_y), 
+                    (corner_x + 8, corner_y), color, 4, lineType=cv2.LINE_8)
+            cv2.line(canvas, (corner_x, corner_y + corner_size), 
+                    (corner_x, corner_y + 8), color, 4, lineType=cv2.LINE_8)
         
         # Center crosshair - larger
-        cv2.line(frame, (center_x - 25, center_y), (center_x + 25, center_y), color, 3)
-        cv2.line(frame, (center_x, center_y - 25), (center_x, center_y + 25), color, 3)
+        cv2.line(canvas, (center_x - 25, center_y), (center_x + 25, center_y), color, 3, lineType=cv2.LINE_8)
+        cv2.line(canvas, (center_x, center_y - 25), (center_x, center_y + 25), color, 3, lineType=cv2.LINE_8)
         
         # Add corner frame indicators to show full frame boundaries
         frame_corner_size = 40
@@ -177,33 +235,26 @@ class QRProcessor:
         for corner_x, corner_y in frame_corners:
             # L-shaped frame corners
             if corner_x < width // 2:  # Left side
-                cv2.line(frame, (corner_x, corner_y), (corner_x + frame_corner_size, corner_y), frame_color, 2)
+                cv2.line(canvas, (corner_x, corner_y), (corner_x + frame_corner_size, corner_y), frame_color, 2, lineType=cv2.LINE_8)
                 if corner_y < height // 2:  # Top
-                    cv2.line(frame, (corner_x, corner_y), (corner_x, corner_y + frame_corner_size), frame_color, 2)
+                    cv2.line(canvas, (corner_x, corner_y), (corner_x, corner_y + frame_corner_size), frame_color, 2, lineType=cv2.LINE_8)
                 else:  # Bottom
-                    cv2.line(frame, (corner_x, corner_y), (corner_x, corner_y - frame_corner_size), frame_color, 2)
+                    cv2.line(canvas, (corner_x, corner_y), (corner_x, corner_y - frame_corner_size), frame_color, 2, lineType=cv2.LINE_8)
             else:  # Right side
-                cv2.line(frame, (corner_x, corner_y), (corner_x - frame_corner_size, corner_y), frame_color, 2)
+                cv2.line(canvas, (corner_x, corner_y), (corner_x - frame_corner_size, corner_y), frame_color, 2, lineType=cv2.LINE_8)
                 if corner_y < height // 2:  # Top
-                    cv2.line(frame, (corner_x, corner_y), (corner_x, corner_y + frame_corner_size), frame_color, 2)
+                    cv2.line(canvas, (corner_x, corner_y), (corner_x, corner_y + frame_corner_size), frame_color, 2, lineType=cv2.LINE_8)
                 else:  # Bottom
-                    cv2.line(frame, (corner_x, corner_y), (corner_x, corner_y - frame_corner_size), frame_color, 2)
+                    cv2.line(canvas, (corner_x, corner_y), (corner_x, corner_y - frame_corner_size), frame_color, 2, lineType=cv2.LINE_8)
         
         # Instructions based on lighting - positioned for full frame
         if is_low_light:
-            cv2.putText(frame, "CHE DO YEU SANG - FULL FRAME VIEW", (20, 40), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 255), 2)
-            cv2.putText(frame, "Dat QR vao khung xanh o giua", (20, 70), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+            cv2.putText(canvas, "CHE DO YEU SANG - FULL FRAME VIEW", (20, 40), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 255), 2, lineType=cv2.LINE_8)
+            cv2.putText(canvas, "Dat QR vao khung xanh o giua", (20, 70), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2, lineType=cv2.LINE_8)
         else:
-            cv2.putText(frame, "FULL FRAME MODE - Hien thi toan bo camera", (20, 40), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 0), 2)
-            cv2.putText(frame, "Dat QR vao khung vang o giua", (20, 70), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        
-        # Add brightness indicator
-        brightness_text = f"Brightness: {int(mean_brightness)}"
-        cv2.putText(frame, brightness_text, (width - 200, height - 40), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-        
-        return frame
\ No newline at end of file
+            cv2.putText(canvas, "FULL FRAME MODE - Hien thi toan bo camera", (20, 40), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 0), 2, lineType=cv2.LINE_8)
+            cv2.putText(canvas, "Dat QR vao khung vang o giua", (20, 70), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2, lineType=cv2.LINE_8)
@@ -1,43 +1,77 @@
 import os
 import json
-import glob
+import fnmatch
 import re
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple, Optional, NamedTuple
 from config import Config
 import logging
 
 logger = logging.getLogger(__name__)
 
+class Record(NamedTuple):
+    """Search result row - fields are read by attribute instead of dict lookups"""
+    json_path: str
+    data: Dict[str, Any]
+    name: str
+    cccd: str
+    cmnd: str
+    birth_date: str
+    address: str
+    gender: str
+    issue_date: str
+    created_timestamp: float
+    created: str
+    front_image: Optional[str]
+    back_image: Optional[str]
+    word_path: Optional[str]
+    total_size: int
+    size_mb: float
+
+
 class SearchManager:
     """Enhanced search functionality for CCCD records"""
     
+    # Parsed JSON records keyed by path: {json_path: (mtime, data, searchable_fields)}
+    _record_cache: Dict[str, Tuple[float, Dict[str, Any], Dict[str, str]]] = {}
+    
     @staticmethod
-    def search_records(query: str, search_type: str = "all") -> List[Dict[str, Any]]:
+    def search_records(query: str, search_type: str = "all") -> List[Record]:
         """Search CCCD records by different criteria"""
         results = []
         
         try:
-            # Get all JSON files
-            json_files = glob.glob(os.path.join(Config.SCAN_DIR, "*_data.json")) + \
-                        glob.glob(os.path.join(Config.SCAN_DIR, "*.json"))
+            query_lower = query.lower().strip()
+            
+            # One directory listing each instead of per-record glob/exists calls
+            scan_files = SearchManager._scan_directory(Config.SCAN_DIR)
+            output_files = SearchManager._scan_directory(Config.OUTPUT_DIR)
             
-            for json_file in json_files:
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    # Check if this record matches the search
-                    if SearchManager._matches_search(data, query, search_type):
-                        record = SearchManager._build_record_info(json_file, data)
-                        results.append(record)
-                        
-                except Exception as e:
-                    logger.warning(f"Error reading {json_file}: {e}")
+            json_names = [name for name in scan_files if name.endswith('.json')]
+            
+            # Drop cached records whose JSON file no longer exists
+            json_paths = {os.path.join(Config.SCAN_DIR, name) for name in json_names}
+            for stale_path in SearchManager._record_cache.keys() - json_paths:
+                del SearchManager._record_cache[stale_path]
+            
+            for json_name in json_names:
+                json_file = os.path.join(Config.SCAN_DIR, json_name)
+                mtime = scan_files[json_name][1]
+                
+                entry = SearchManager._load_record(json_file, mtime)
+                if entry is None:
                     continue
+                data, fields = entry
+                
+                # Check if this record matches the search
+                if SearchManager._matches_search(fields, query_lower, search_type):
+                    record = SearchManager._build_record_info(
+                        json_file, data, mtime, scan_files, output_files
+                    )
+                    results.append(record)
             
             # Sort results by creation date (newest first)
-            results.sort(key=lambda x: x.get('created_timestamp', 0), reverse=True)
+            results.sort(key=lambda x: x.created_timestamp, reverse=True)
             
         except Exception as e:
             logger.error(f"Error searching records: {e}")
@@ -45,70 +79,104 @@ class SearchManager:
         return results
     
     @staticmethod
-    def _matches_search(data: Dict[str, Any], query: str, search_type: str) -> bool:
-        """Check if a record matches search criteria"""
-        query_lower = query.lower().strip()
+    def _scan_directory(directory: str) -> Dict[str, Tuple[int, float]]:
+        """List regular files in directory as {filename: (size, mtime)}"""
+        files = {}
+        
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            stat = entry.stat()
+                            files[entry.name] = (stat.st_size, stat.st_mtime)
+                    except OSError:
+                        continue
+        except FileNotFoundError:
+            pass
+        
+        return files
+    
+    @staticmethod
+    def _load_record(json_file: str, mtime: float):
+        """Load a record's data and searchable fields, reusing the cache when unchanged"""
+        cached = SearchManager._record_cache.get(json_file)
+        if cached and cached[0] == mtime:
+            return cached[1], cached[2]
         
+        try:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            # Extract searchable fields once, lowercased
+            fields = {
+                'name': data.get("Họ và tên", "").lower(),
+                'cccd': data.get("Số CCCD", "").lower(),
+                'cmnd': data.get("Số CMND", "").lower(),
+                'birth_date': data.get("Ngày tháng năm sinh", "").lower(),
+                'address': data.get("Địa chỉ", "").lower(),
+                'gender': data.get("Giới tính", "").lower(),
+                'issue_date': data.get("Ngày cấp CCCD", "").lower(),
+                'expiry_date': data.get("Ngày đến hạn CCCD", "").lower(),
+            }
+            fields['all'] = " ".join([
+                fields['name'], fields['cccd'], fields['cmnd'], fields['birth_date'],
+                fields['address'], fields['gender'], fields['issue_date'], fields['expiry_date']
+            ])
+            
+        except Exception as e:
+            logger.warning(f"Error reading {json_file}: {e}")
+            return None
+        
+        SearchManager._record_cache[json_file] = (mtime, data, fields)
+        return data, fields
+    
+    @staticmethod
+    def _matches_search(fields: Dict[str, str], query_lower: str, search_type: str) -> bool:
+        """Check if a record's searchable fields match search criteria"""
         if not query_lower:
             return True  # Empty query returns all
         
-        # Extract searchable fields
-        name = data.get("Họ và tên", "").lower()
-        cccd = data.get("Số CCCD", "").lower()
-        cmnd = data.get("Số CMND", "").lower()
-        birth_date = data.get("Ngày tháng năm sinh", "").lower()
-        address = data.get("Địa chỉ", "").lower()
-        gender = data.get("Giới tính", "").lower()
-        issue_date = data.get("Ngày cấp CCCD", "").lower()
-        expiry_date = data.get("Ngày đến hạn CCCD", "").lower()
-        
         if search_type == "all":
             # Search in all fields
-            searchable_text = f"{name} {cccd} {cmnd} {birth_date} {address} {gender} {issue_date} {expiry_date}"
-            return query_lower in searchable_text
+            return query_lower in fields['all']
         elif search_type == "name":
-            return query_lower in name
+            return query_lower in fields['name']
         elif search_type == "cccd":
-            return query_lower in cccd
+            return query_lower in fields['cccd']
         elif search_type == "cmnd":
-            return query_lower in cmnd
+            return query_lower in fields['cmnd']
         elif search_type == "date":
-            return query_lower in birth_date or query_lower in issue_date or query_lower in expiry_date
+            return (query_lower in fields['birth_date'] or 
+                    query_lower in fields['issue_date'] or 
+                    query_lower in fields['expiry_date'])
         elif search_type == "expiry":
-            return query_lower in expiry_date
+            return query_lower in fields['expiry_date']
 
         return False
     
     @staticmethod
-    def _build_record_info(json_file: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _build_record_info(json_file: str, data: Dict[str, Any], mtime: float,
+                           scan_files: Dict[str, Tuple[int, float]],
+                           output_files: Dict[str, Tuple[int, float]]) -> Record:
         """Build comprehensive record information"""
-        base_name = json_file.replace('_data.json', '').replace('.json', '')
-        
-        record = {
-            'json_path': json_file,
-            'data': data,
-            'name': data.get("Họ và tên", "N/A"),
-            'cccd': data.get("Số CCCD", "N/A"),
-            'cmnd': data.get("Số CMND", "N/A"),
-            'birth_date': data.get("Ngày tháng năm sinh", "N/A"),
-            'address': data.get("Địa chỉ", "N/A"),
-            'gender': data.get("Giới tính", "N/A"),
-            'issue_date': data.get("Ngày cấp CCCD", "N/A"),
-        }
+        base_name = os.path.basename(json_file).replace('_data.json', '').replace('.json', '')
+        name = data.get("Họ và tên", "N/A")
         
         # File timestamps
         try:
-            created_time = os.path.getmtime(json_file)
-            record['created_timestamp'] = created_time
-            record['created'] = datetime.fromtimestamp(created_time).strftime("%d/%m/%Y %H:%M:%S")
+            created_timestamp = mtime
+            created = datetime.fromtimestamp(mtime).strftime("%d/%m/%Y %H:%M:%S")
         except:
-            record['created'] = "N/A"
-            record['created_timestamp'] = 0
+            created = "N/A"
+            created_timestamp = 0
         
         # Associated files
-        record['front_image'] = None
-        record['back_image'] = None
-        record['word_path'] = None
+        front_image = None
+        back_image = None
+        word_path = None
+        
+        total_size = scan_files.get(os.path.basename(json_file), (0, 0))[0]
         
         # Find front and back images
         possible_front_patterns = [
@@ -121,17 +189,19 @@ class SearchManager:
         ]
         
         for pattern in possible_front_patterns:
-            if os.path.exists(pattern):
-                record['front_image'] = pattern
+            if pattern in scan_files:
+                front_image = os.path.join(Config.SCAN_DIR, pattern)
+                total_size += scan_files[pattern][0]
                 break
         
         for pattern in possible_back_patterns:
-            if os.path.exists(pattern):
-                record['back_image'] = pattern
+            if pattern in scan_files:
+                back_image = os.path.join(Config.SCAN_DIR, pattern)
+                total_size += scan_files[pattern][0]
                 break
         
         # Find Word document
-        safe_name = re.sub(r'[^\w\s-]', '', record['name']).strip()
+        safe_name = re.sub(r'[^\w\s-]', '', name).strip()
         safe_name = re.sub(r'[-\s]+', '_', safe_name)
         
         doc_patterns = [
@@ -141,27 +211,35 @@ class SearchManager:
         ]
         
         for pattern in doc_patterns:
-            doc_files = glob.glob(os.path.join(Config.OUTPUT_DIR, pattern))
+            doc_files = fnmatch.filter(output_files, pattern)
             if doc_files:
-                record['word_path'] = doc_files[0]
+                word_path = os.path.join(Config.OUTPUT_DIR, doc_files[0])
+                total_size += output_files[doc_files[0]][0]
                 break
         
-        # Calculate file sizes
-        record['total_size'] = 0
-        for file_path in [record['json_path'], record['front_image'], record['back_image'], record['word_path']]:
-            if file_path and os.path.exists(file_path):
-                try:
-                    record['total_size'] += os.path.getsize(file_path)
-                except:
-                    pass
-        
-        record['size_mb'] = round(record['total_size'] / (1024 * 1024), 2)
-        
-        return record
+        # File sizes come from the directory listing, no extra stat calls
+        return Record(
+            json_path=json_file,
+            data=data,
+            name=name,
+            cccd=data.get("Số CCCD", "N/A"),
+            cmnd=data.get("Số CMND", "N/A"),
+            birth_date=data.get("Ngày tháng năm sinh", "N/A"),
+            address=data.get("Địa chỉ", "N/A"),
+            gender=data.get("Giới tính", "N/A"),
+            issue_date=data.get("Ngày cấp CCCD", "N/A"),
+            created_timestamp=created_timestamp,
+            created=created,
+            front_image=front_image,
+            back_image=back_image,
+            word_path=word_path,
+            total_size=total_size,
+            size_mb=round(total_size / (1024 * 1024), 2)
+        )
     
     @staticmethod
-    def get_statistics() -> Dict[str, Any]:
-        """Get database statistics"""
+    def get_statistics(records: Optional[List[Record]] = None) -> Dict[str, Any]:
+        """Get database statistics, optionally from already loaded records"""
         stats = {
             'total_records': 0,
             'total_size_mb': 0,
@@ -172,24 +250,25 @@ class SearchManager:
         }
         
         try:
-            records = SearchManager.search_records("", "all")
+            if records is None:
+                records = SearchManager.search_records("", "all")
             stats['total_records'] = len(records)
             
             total_size = 0
             for record in records:
-                total_size += record.get('total_size', 0)
+                total_size += record.total_size
                 
-                if record.get('word_path'):
+                if record.word_path:
                     stats['records_with_word'] += 1
                 
-                if record.get('front_image') or record.get('back_image'):
+                if record.front_image or record.back_image:
                     stats['records_with_images'] += 1
             
             stats['total_size_mb'] = round(total_size / (1024 * 1024), 2)
             
             if records:
-                stats['oldest_record'] = records[-1]['created']
-                stats['newest_record'] = records[0]['created']
+                stats['oldest_record'] = records[-1].created
+                stats['newest_record'] = records[0].created
             
         except Exception as e:
             logger.error(f"Error getting statistics: {e}")
@@ -2,10 +2,12 @@ import customtkinter as ctk
 import os
 from datetime import datetime
 from tkinter import messagebox, filedialog
-from typing import Dict, Any, List
-from database.search_manager import SearchManager
+from typing import Dict, List, Optional, Tuple
+from database.search_manager import SearchManager, Record
+from core.file_manager import FileManager
 from gui.dialogs.view_record_dialog import ViewRecordDialog
 import csv
+import gzip
 import logging
 
 logger = logging.getLogger(__name__)
@@ -26,6 +28,14 @@ class SearchDialog(ctk.CTkToplevel):
         
         self.search_results = []
         
+        # "Show all" results, reused by _clear_search until a record is deleted
+        self._all_records_cache: Optional[List[Record]] = None
+        
+        # Result item frames reused across searches, keyed by (json_path, file mtime) so a
+        # record rewritten on disk gets a fresh row instead of stale text and callbacks
+        self._item_pool: Dict[Tuple[str, float], ctk.CTkFrame] = {}
+        self._item_order: List[Tuple[str, float]] = []
+        
         self._create_ui()
         self._load_initial_data()
         
@@ -168,6 +178,14 @@ class SearchDialog(ctk.CTkToplevel):
             scrollbar_fg_color="#333333"
         )
         self.results_container.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        
+        # No-results message, created once and shown/hidden as needed
+        self._empty_label = ctk.CTkLabel(
+            self.results_container,
+            text="🔍 Không tìm thấy kết quả nào\n\nThử thay đổi từ khóa tìm kiếm hoặc loại tìm kiếm",
+            font=("Arial", 14),
+            text_color="#AAAAAA"
+        )
     
     def _create_bottom_controls(self, parent):
         """Create bottom control buttons"""
@@ -216,8 +234,9 @@ class SearchDialog(ctk.CTkToplevel):
     def _load_initial_data(self):
         """Load initial data and statistics"""
         try:
-            # Load statistics
-            stats = SearchManager.get_statistics()
+            # Load all records once and derive statistics from them
+            self._all_records_cache = SearchManager.search_records("", "all")
+            stats = SearchManager.get_statistics(self._all_records_cache)
             stats_text = f"📊 {stats['total_records']} records | 💾 {stats['total_size_mb']} MB | 📄 {stats['records_with_word']} docs | 📷 {stats['records_with_images']} có ảnh"
             self.stats_label.configure(text=stats_text)
             
@@ -271,43 +290,55 @@ class SearchDialog(ctk.CTkToplevel):
         """Clear search and show all records"""
         self.search_entry.delete(0, "end")
         self.search_type.set("Tất cả")
-        self.search_results = SearchManager.search_records("", "all")
+        if self._all_records_cache is None:
+            self._all_records_cache = SearchManager.search_records("", "all")
+        self.search_results = self._all_records_cache
         self._display_results()
         
         result_count = len(self.search_results)
         self.result_stats.configure(text=f"📋 Hiển thị tất cả {result_count} records")
     
     def _display_results(self):
-        """Display search results"""
-        # Clear existing results
-        for widget in self.results_container.winfo_children():
-            widget.destroy()
+        """Display search results, reusing item frames from previous searches"""
+        new_ids = [(record.json_path, record.created_timestamp) for record in self.search_results]
+        new_id_set = set(new_ids)
+        
+        # Destroy only the frames whose records are no longer in the results
+        for record_id in self._item_pool.keys() - new_id_set:
+            self._item_pool.pop(record_id).destroy()
         
         if not self.search_results:
-            no_results_label = ctk.CTkLabel(
-                self.results_container,
-                text="🔍 Không tìm thấy kết quả nào\n\nThử thay đổi từ khóa tìm kiếm hoặc loại tìm kiếm",
-                font=("Arial", 14),
-                text_color="#AAAAAA"
-            )
-            no_results_label.pack(pady=50)
+            self._item_order = []
+            self._empty_label.pack(pady=50)
             return
         
-        # Display results
-        for i, record in enumerate(self.search_results):
-            self._create_result_item(record, i)
-    
-    def _create_result_item(self, record: Dict[str, Any], index: int):
-        """Create a result item widget"""
-        # Alternating colors
-        bg_color = "#1a1a1a" if index % 2 == 0 else "#2a2a2a"
+        self._empty_label.pack_forget()
+        
+        # Create frames only for records (or record versions) not shown before
+        for record_id, record in zip(new_ids, self.search_results):
+            if record_id not in self._item_pool:
+                self._item_pool[record_id] = self._create_result_item(record)
         
+        # Repack in result order only when the order actually changed
+        if new_ids != self._item_order:
+            for record_id in self._item_order:
+                if record_id in self._item_pool:
+                    self._item_pool[record_id].pack_forget()
+            
+            for i, record_id in enumerate(new_ids):
+                item_frame = self._item_pool[record_id]
+                # Alternating colors
+                item_frame.configure(fg_color="#1a1a1a" if i % 2 == 0 else "#2a2a2a")
+                item_frame.pack(fill="x", padx=5, pady=2)
+            
+            self._item_order = new_ids
+    
+    def _create_result_item(self, record: Record) -> ctk.CTkFrame:
+        """Create a result item widget (packed by _display_results)"""
         item_frame = ctk.CTkFrame(
             self.results_container,
-            fg_color=bg_color,
             corner_radius=8
         )
-        item_frame.pack(fill="x", padx=5, pady=2)
         
         # Configure grid
         item_frame.grid_columnconfigure(1, weight=1)
@@ -319,7 +350,7 @@ class SearchDialog(ctk.CTkToplevel):
         # Name
         name_label = ctk.CTkLabel(
             info_frame,
-            text=f"👤 {record['name']}",
+            text=f"👤 {record.name}",
             font=("Arial", 14, "bold"),
             text_color="#00FFFF",
             anchor="w"
@@ -327,9 +358,9 @@ class SearchDialog(ctk.CTkToplevel):
         name_label.pack(anchor="w")
         
         # ID numbers
-        id_text = f"🆔 CCCD: {record['cccd']}"
-        if record['cmnd'] != "N/A":
-            id_text += f" | CMND: {record['cmnd']}"
+        id_text = f"🆔 CCCD: {record.cccd}"
+        if record.cmnd != "N/A":
+            id_text += f" | CMND: {record.cmnd}"
         
         id_label = ctk.CTkLabel(
             info_frame,
@@ -341,9 +372,9 @@ class SearchDialog(ctk.CTkToplevel):
         id_label.pack(anchor="w")
         
         # Birth date and gender
-        personal_text = f"🎂 {record['birth_date']}"
-        if record['gender'] != "N/A":
-            personal_text += f" | {record['gender']}"
+        personal_text = f"🎂 {record.birth_date}"
+        if record.gender != "N/A":
+            personal_text += f" | {record.gender}"
         
         personal_label = ctk.CTkLabel(
             info_frame,
@@ -360,11 +391,11 @@ class SearchDialog(ctk.CTkToplevel):
         
         # File status
         file_status = []
-        if record['word_path'] and os.path.exists(record['word_path']):
+        if record.word_path and os.path.exists(record.word_path):
             file_status.append("📄 Word")
-        if record['front_image'] and os.path.exists(record['front_image']):
+        if record.front_image and os.path.exists(record.front_image):
             file_status.append("📸 Front")
-        if record['back_image'] and os.path.exists(record['back_image']):
+        if record.back_image and os.path.exists(record.back_image):
             file_status.append("📸 Back")
         
         status_text = " | ".join(file_status) if file_status else "❌ Thiếu file"
@@ -379,7 +410,7 @@ class SearchDialog(ctk.CTkToplevel):
         status_label.pack(anchor="w")
         
         # Created date and size
-        meta_text = f"📅 {record['created']} | 💾 {record['size_mb']} MB"
+        meta_text = f"📅 {record.created} | 💾 {record.size_mb} MB"
         meta_label = ctk.CTkLabel(
             file_frame,
             text=meta_text,
@@ -431,37 +462,36 @@ class SearchDialog(ctk.CTkToplevel):
             font=("Arial", 10)
         )
         delete_btn.pack(pady=2)
+        
+        return item_frame
     
-    def _view_record(self, record: Dict[str, Any]):
+    def _view_record(self, record: Record):
         """View detailed record information"""
         ViewRecordDialog(self, record)
     
-    def _open_record_folder(self, record: Dict[str, Any]):
+    def _open_record_folder(self, record: Record):
         """Open folder containing record files"""
         try:
-            folder_path = os.path.dirname(record['json_path'])
-            if os.name == 'nt':
-                os.startfile(folder_path)
-            elif os.name == 'posix':
-                os.system(f'open "{folder_path}"')
+            folder_path = os.path.dirname(record.json_path)
+            FileManager.open_folder(folder_path)
         except Exception as e:
             messagebox.showerror("Lỗi", f"Không thể mở thư mục: {str(e)}")
     
-    def _delete_record(self, record: Dict[str, Any]):
+    def _delete_record(self, record: Record):
         """Delete record and associated files"""
         response = messagebox.askyesno(
             "Xác nhận xóa",
-            f"Bạn có chắc muốn xóa record của:\n{record['name']}\n\n"
+            f"Bạn có chắc muốn xóa record của:\n{record.name}\n\n"
             "Tất cả file liên quan sẽ bị xóa vĩnh viễn!"
         )
         
         if response:
             try:
                 files_to_delete = [
-                    record['json_path'],
-                    record['front_image'],
-                    record['back_image'],
-                    record['word_path']
+                    record.json_path,
+                    record.front_image,
+                    record.back_image,
+                    record.word_path
                 ]
                 
                 deleted_count = 0
@@ -470,7 +500,9 @@ class SearchDialog(ctk.CTkToplevel):
                         os.remove(file_path)
                         deleted_count += 1
                 
-                messagebox.showinfo("Thành công", f"Đã xóa {deleted_count} file của {record['name']}")
+                messagebox.showinfo("Thành công", f"Đã xóa {deleted_count} file của {record.name}")
+                
+                self._all_records_cache = None
                 
                 # Refresh display
                 self._perform_search()
@@ -487,13 +519,19 @@ class SearchDialog(ctk.CTkToplevel):
             
             # Ask for save location
             filename = filedialog.asksaveasfilename(
-                defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+                defaultextension=".csv.gz",
+                filetypes=[("CSV nén gzip", "*.csv.gz"), ("CSV files", "*.csv"), ("All files", "*.*")],
                 title="Lưu file CSV"
             )
             
             if filename:
-                with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+                # Stream through gzip (fast level) unless a plain .csv was chosen
+                if filename.lower().endswith('.gz'):
+                    csvfile_ctx = gzip.open(filename, 'wt', newline='', encoding='utf-8', compresslevel=1)
+                else:
+                    csvfile_ctx = open(filename, 'w', newline='', encoding='utf-8')
+                
+                with csvfile_ctx as csvfile:
                     writer = csv.writer(csvfile)
                     
                     # Header
@@ -504,20 +542,22 @@ class SearchDialog(ctk.CTkToplevel):
                     ])
                     
                     # Data rows
-                    for record in self.search_results:
-                        writer.writerow([
-                            record['name'],
-                            record['cccd'],
-                            record['cmnd'],
-                            record['birth_date'],
-                            record['gender'],
-                            record.get('address', 'N/A'),
-                            record.get('issue_date', 'N/A'),
-                            record['created'],
-                            record['size_mb'],
-                            "Có" if record['word_path'] else "Không",
-                            "Có" if (record['front_image'] or record['back_image']) else "Không"
-                        ])
+                    writer.writerows(
+                        (
+                            record.name,
+                            record.cccd,
+                            record.cmnd,
+                            record.birth_date,
+                            record.gender,
+                            record.address,
+                            record.issue_date,
+                            record.created,
+                            record.size_mb,
+                            "Có" if record.word_path else "Không",
+                            "Có" if (record.front_image or record.back_image) else "Không"
+                        )
+                        for record in self.search_results
+                    )
                 
                 messagebox.showinfo("Thành công", f"Đã xuất {len(self.search_results)} records ra file:\n{filename}")
                 
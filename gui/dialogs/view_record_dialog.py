@@ -1,6 +1,6 @@
 import customtkinter as ctk
 import os
-from typing import Dict, Any
+from database.search_manager import Record
 import logging
 
 logger = logging.getLogger(__name__)
@@ -8,9 +8,9 @@ logger = logging.getLogger(__name__)
 class ViewRecordDialog(ctk.CTkToplevel):
     """Dialog for viewing detailed record information"""
     
-    def __init__(self, parent, record: Dict[str, Any]):
+    def __init__(self, parent, record: Record):
         super().__init__(parent)
-        self.title(f"👁️ Chi tiết - {record['name']}")
+        self.title(f"👁️ Chi tiết - {record.name}")
         self.geometry("800x600")
         self.resizable(True, True)
         
@@ -38,7 +38,7 @@ class ViewRecordDialog(ctk.CTkToplevel):
         
         title_label = ctk.CTkLabel(
             header_frame,
-            text=f"👤 {self.record['name']}",
+            text=f"👤 {self.record.name}",
             font=("Arial", 20, "bold"),
             text_color="#00FFFF"
         )
\ No newline at end of file
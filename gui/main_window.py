@@ -1,7 +1,12 @@
 import customtkinter as ctk
 import threading
+import queue
+import collections
+import time
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from typing import Optional, Dict, Any
+import cv2
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 import logging
 import os
@@ -37,6 +42,95 @@ from buttons.utility_buttons import UtilityButtons
 
 logger = logging.getLogger(__name__)
 
+# Welcome text shown in the activity log; filled with str.format_map
+_WELCOME_TEMPLATE = """🚀 Welcome to AGRIBANK ID Scanner Professional v{version}!
+
+🏗️ FULL FRAME CAMERA + MULTI-CAMERA SUPPORT + ADVANCED SEARCH:
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+📹 **FULL FRAME CAMERA FEATURES**:
+• 🖼️ **Full Frame Display** - Hiển thị đầy đủ khung camera, không crop
+• 📱 **Complete View** - Xem toàn bộ góc nhìn camera
+• 🎯 **No Zoom/Crop** - Giữ nguyên tỷ lệ và size gốc
+• 📏 **Aspect Ratio Preserved** - Tỷ lệ khung hình được bảo toàn
+• 🔍 **Enhanced Guidance** - Guidance overlay tối ưu cho full frame
+
+📹 **CAMERA SELECTION FEATURES**:
+• 🔍 **Auto Camera Detection** - Tự động quét và phát hiện camera có sẵn
+• 📱 **Multi-Camera Support** - Hỗ trợ nhiều camera cùng lúc
+• 🔄 **Dynamic Switch** - Chuyển đổi camera trong khi chạy
+• 🎯 **Smart Detection** - Phát hiện resolution và backend camera
+• ⚡ **Real-time Refresh** - Làm mới danh sách camera real-time
+
+📊 **CAMERA DETECTED**: {camera_count} camera(s) found
+{camera_list}
+
+📐 **DYNAMIC 3-PANEL LAYOUT**: 
+┌─────────────────────┬───────────────┬──────────────┐
+│   📹 CAMERA (50%)    │  📄 DATA (33%) │ 📊 LOG (17%) │
+│                     │               │              │
+│  • Full frame view  │ • QR Info     │ • Activity   │
+│  • Camera dropdown  │ • Capture     │ • Status     │
+│  • Complete preview │ • Controls    │ • Messages   │
+└─────────────────────┴───────────────┴──────────────┘
+
+🎮 **FULL FRAME CONTROLS**:
+📹 **Camera Selection**: Dropdown để chọn camera
+🔄 **Refresh Button**: Quét lại danh sách camera
+🎥 **Start/Stop**: Bật/tắt camera đã chọn (full frame)
+🖼️ **Full Preview**: Hiển thị toàn bộ khung camera
+🔍 **QR Focus**: Focus mode cho QR code nhỏ
+🔄 **Rescan QR**: Quét lại QR code mới
+
+🖼️ **FULL FRAME ADVANTAGES**:
+• 📐 **Complete Field of View** - Nhìn thấy toàn bộ góc quay camera
+• 🎯 **Better QR Detection** - QR code ở bất kỳ vị trí nào đều được detect
+• 📏 **True Aspect Ratio** - Không bị méo hình do crop
+• 🔍 **Enhanced Visibility** - Thấy rõ context xung quanh QR code
+• 📱 **Professional View** - Giao diện chuyên nghiệp như camera monitor
+
+🔍 **ADVANCED SEARCH DATABASE v{version}**:
+• 🗄️ **Comprehensive Search** - Tìm kiếm theo tên, CCCD, CMND, ngày tháng
+• 📊 **Database Statistics** - Thống kê tổng quan và phân tích dữ liệu
+• 👁️ **Detailed View** - Xem chi tiết từng record với đầy đủ thông tin
+• 🔄 **Smart Duplicate Detection** - Phát hiện và xử lý trùng lặp thông minh
+• 📁 **File Management** - Quản lý file Word, ảnh, JSON tập trung
+• 📋 **Export to CSV** - Xuất dữ liệu ra CSV cho báo cáo
+
+🎯 **FULL FRAME CAMERA WORKFLOW v{version}**:
+1️⃣ Chọn camera từ dropdown → Camera được nhận diện tự động
+2️⃣ Click 'START CAMERA' → Full frame preview bắt đầu
+3️⃣ Xem toàn bộ khung camera → Không bị crop hay zoom
+4️⃣ Position QR code → QR guidance overlay trên full frame
+5️⃣ Auto-detection QR → Detect QR ở bất kỳ vị trí nào
+6️⃣ System locks QR data → Duplicate check trong database
+7️⃣ Capture FRONT/BACK → Full frame images được lưu
+8️⃣ Save document → Auto-add vào searchable database
+
+💡 **FULL FRAME TIPS**:
+🖼️ Full frame hiển thị toàn bộ góc nhìn camera
+📐 Aspect ratio được bảo toàn hoàn toàn
+🎯 QR code có thể ở bất kỳ vị trí nào trong frame
+🔍 Guidance overlay tối ưu cho full frame view
+📱 Camera selection tự động detect resolution
+⚡ Preview không bị méo hay crop
+🎨 UI tự động scale theo camera resolution
+
+🆕 **NEW FULL FRAME FEATURES v{version}**:
+🖼️ Complete camera frame display - no cropping
+📐 True aspect ratio preservation
+🎯 Enhanced QR detection area coverage
+📏 Frame size indicator overlay
+⚡ Optimized guidance for full frame
+🎨 Professional camera monitor experience
+
+🔧 **READY TO START**: 
+1. Chọn camera từ dropdown (full frame mode)
+2. Click 'START CAMERA' để xem toàn bộ khung hình
+3. Hoặc 'SEARCH DB' để tìm kiếm!
+
+🎨 **Experience the most advanced full-frame multi-camera CCCD scanner!**"""
+
 
 class VietnameseIDScannerGUI:
     """Main application class with modular architecture and camera selection"""
@@ -58,20 +152,38 @@ class VietnameseIDScannerGUI:
         self.qr_processor = QRProcessor()
         self.id_parser = IDDataParser()
         
+        # Camera list snapshot for UI text, refreshed with the camera list
+        self.available_cameras: Dict[int, str] = self.camera_manager.get_available_cameras()
+        
         # Application state
         self.scanning = False
-        self.detected_qrs = set()
+        # Hashes of the raw QR payloads already dispatched, kept as a bounded LRU
+        self.detected_qrs = collections.OrderedDict()
+        self.qr_lock = threading.Lock()  # Guards detected_qrs across the video and Tk threads
         self.current_frame: Optional[np.ndarray] = None
+        self.frame_lock = threading.Lock()  # Guards current_frame between the video thread and capture buttons
         self.front_image: Optional[np.ndarray] = None
         self.back_image: Optional[np.ndarray] = None
         self.current_id_info: Optional[Dict[str, str]] = None
+        self.current_qr_content: Optional[str] = None
         self.qr_focus_mode = False
         self.qr_locked = False
+        # Bumped by Reset/Rescan so lookups still in flight on the pool are dropped
+        self._qr_generation = 0
+        
+        # Log updates queued for the next idle drain: (message, append)
+        self._log_queue = collections.deque()
+        self._log_pending = False
         
-        # UI components will be initialized by panels
+        # Pre-rendered "QR LOCKED" text: (frame_shape, roi, overlay, mask)
+        self._locked_overlay = None
+        
+        # UI componentswill be initialized by panels
         self.cam_panel: Optional[ctk.CTkLabel] = None
         self.content_text: Optional[ctk.CTkTextbox] = None
         self.data_labels: Dict[str, ctk.CTkLabel] = {}
+        self._label_texts: Dict[str, str] = {}  # Last text set on each data label
+        self._label_update_plan: tuple = ()     # (field, label) pairs, frozen once the data panel exists
         
         # Control buttons will be initialized by button handlers
         self.camera_btn: Optional[ctk.CTkButton] = None
@@ -104,9 +216,20 @@ class VietnameseIDScannerGUI:
         # Setup GUI
         self._setup_gui()
         
-        # Video thread
+        # Video threads: producer reads the camera, consumer (video_thread) detects and displays
         self.video_thread: Optional[threading.Thread] = None
+        self.producer_thread: Optional[threading.Thread] = None
         self.stop_video_event = threading.Event()
+        self._frame_q: queue.Queue = queue.Queue(maxsize=2)
+        
+        # Jobs posted from worker threads, run on the Tk thread by _tk_drain: (fn, args)
+        self._ui_q: queue.Queue = queue.Queue()
+        
+        # Shared worker pool for off-Tk-thread jobs (QR parsing, duplicate-check disk scan)
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scan")
+        
+        # Set once _cleanup has run - it is reached from both _on_closing and run()
+        self._cleaned = False
         
         # Camera retry counter
         self.camera_retry_count = 0
@@ -117,6 +240,11 @@ class VietnameseIDScannerGUI:
         root = ctk.CTk()
         root.title(self.config.APP_TITLE)
         
+        # Pending debounced resize callback, last root size seen and panel weights applied
+        self._resize_after_id = None
+        self._last_root_size = None
+        self._panel_weights = None
+        
         # Set fullscreen mode
         root.attributes('-fullscreen', True)
         
@@ -163,19 +291,28 @@ class VietnameseIDScannerGUI:
             self.root.geometry(f'{window_width}x{window_height}+{x}+{y}')
     
     def _on_window_resize(self, event):
-        """Handle window resize events for dynamic layout adjustments"""
+        """Handle window resize events - debounced so a drag triggers one layout pass"""
         if event.widget == self.root:
-            try:
-                current_width = self.root.winfo_width()
-                current_height = self.root.winfo_height()
-                
-                self._adjust_panel_proportions(current_width, current_height)
-                
-                if hasattr(self, 'cam_panel') and self.scanning:
-                    self.root.after(100, self._update_camera_size)
-                    
-            except Exception as e:
-                logger.error(f"Error handling window resize: {e}")
+            # <Configure> also fires on moves and restacking - ignore those
+            size = (event.width, event.height)
+            if size == self._last_root_size:
+                return
+            self._last_root_size = size
+            
+            if self._resize_after_id is not None:
+                self.root.after_cancel(self._resize_after_id)
+            self._resize_after_id = self.root.after(150, self._do_resize)
+    
+    def _do_resize(self):
+        """Apply dynamic layout adjustments once the resize has settled"""
+        self._resize_after_id = None
+        try:
+            current_width, current_height = self._last_root_size
+            
+            self._adjust_panel_proportions(current_width, current_height)
+            
+        except Exception as e:
+            logger.error(f"Error handling window resize: {e}")
     
     def _adjust_panel_proportions(self, width: int, height: int):
         """Dynamically adjust panel proportions based on window size"""
@@ -193,7 +330,10 @@ class VietnameseIDScannerGUI:
                 data_weight = 2
                 log_weight = 1
             
-            if hasattr(self, 'workspace'):
+            # Only re-grid when the size class actually changed
+            weights = (camera_weight, data_weight, log_weight)
+            if hasattr(self, 'workspace') and weights != self._panel_weights:
+                self._panel_weights = weights
                 self.workspace.grid_columnconfigure(0, weight=camera_weight)
                 self.workspace.grid_columnconfigure(1, weight=data_weight)
                 self.workspace.grid_columnconfigure(2, weight=log_weight)
@@ -201,14 +341,6 @@ class VietnameseIDScannerGUI:
         except Exception as e:
             logger.error(f"Error adjusting panel proportions: {e}")
     
-    def _update_camera_size(self):
-        """Update camera display size based on current panel size"""
-        try:
-            if hasattr(self, 'cam_panel') and self.cam_panel.winfo_exists():
-                self.cam_panel.update_idletasks()
-        except Exception as e:
-            logger.error(f"Error updating camera size: {e}")
-    
     def _setup_gui(self):
         """Setup responsive GUI with CustomTkinter"""
         # Header section - row 0
@@ -288,6 +420,10 @@ class VietnameseIDScannerGUI:
         # Create the three main panels using panel handlers
         self.camera_panel_handler.create_camera_panel(self.workspace)
         self.data_panel_handler.create_data_panel(self.workspace)
+        self._label_update_plan = tuple(
+            (field, self.data_labels[field])
+            for field in IDDataParser.FIELD_MAPPING if field in self.data_labels
+        )
         self.log_panel_handler.create_log_panel(self.workspace)
         
         # Initial proportion adjustment
@@ -350,7 +486,7 @@ class VietnameseIDScannerGUI:
         status_content.pack(fill="x", padx=15, pady=8)
         
         # Status info with camera count
-        camera_count = len(self.camera_manager.get_available_cameras())
+        camera_count = len(self.available_cameras)
         status_text = f"🎯 Multi-Camera v{self.config.VERSION} | 📹 {camera_count} Cameras | 🔍 Advanced Search | ⚡ Professional Design"
         status_label = ctk.CTkLabel(
             status_content,
@@ -366,169 +502,286 @@ class VietnameseIDScannerGUI:
     
     def _show_welcome_message(self):
         """Show welcome message with camera selection info"""
-        camera_count = len(self.camera_manager.get_available_cameras())
-        available_cameras = self.camera_manager.get_available_cameras()
+        available_cameras = self.available_cameras
+        camera_count = len(available_cameras)
         
-        camera_list_text = ""
-        for index, name in available_cameras.items():
-            camera_list_text += f"  📹 Camera {index}: {name}\n"
+        camera_list = "".join(
+            f"  📹 Camera {index}: {name}\n" for index, name in available_cameras.items()
+        )
         
-        welcome_text = f"""🚀 Welcome to AGRIBANK ID Scanner Professional v{self.config.VERSION}!
-
-🏗️ FULL FRAME CAMERA + MULTI-CAMERA SUPPORT + ADVANCED SEARCH:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-📹 **FULL FRAME CAMERA FEATURES**:
-• 🖼️ **Full Frame Display** - Hiển thị đầy đủ khung camera, không crop
-• 📱 **Complete View** - Xem toàn bộ góc nhìn camera
-• 🎯 **No Zoom/Crop** - Giữ nguyên tỷ lệ và size gốc
-• 📏 **Aspect Ratio Preserved** - Tỷ lệ khung hình được bảo toàn
-• 🔍 **Enhanced Guidance** - Guidance overlay tối ưu cho full frame
-
-📹 **CAMERA SELECTION FEATURES**:
-• 🔍 **Auto Camera Detection** - Tự động quét và phát hiện camera có sẵn
-• 📱 **Multi-Camera Support** - Hỗ trợ nhiều camera cùng lúc
-• 🔄 **Dynamic Switch** - Chuyển đổi camera trong khi chạy
-• 🎯 **Smart Detection** - Phát hiện resolution và backend camera
-• ⚡ **Real-time Refresh** - Làm mới danh sách camera real-time
-
-📊 **CAMERA DETECTED**: {camera_count} camera(s) found
-{camera_list_text}
-
-📐 **DYNAMIC 3-PANEL LAYOUT**: 
-┌─────────────────────┬───────────────┬──────────────┐
-│   📹 CAMERA (50%)    │  📄 DATA (33%) │ 📊 LOG (17%) │
-│                     │               │              │
-│  • Full frame view  │ • QR Info     │ • Activity   │
-│  • Camera dropdown  │ • Capture     │ • Status     │
-│  • Complete preview │ • Controls    │ • Messages   │
-└─────────────────────┴───────────────┴──────────────┘
-
-🎮 **FULL FRAME CONTROLS**:
-📹 **Camera Selection**: Dropdown để chọn camera
-🔄 **Refresh Button**: Quét lại danh sách camera
-🎥 **Start/Stop**: Bật/tắt camera đã chọn (full frame)
-🖼️ **Full Preview**: Hiển thị toàn bộ khung camera
-🔍 **QR Focus**: Focus mode cho QR code nhỏ
-🔄 **Rescan QR**: Quét lại QR code mới
-
-🖼️ **FULL FRAME ADVANTAGES**:
-• 📐 **Complete Field of View** - Nhìn thấy toàn bộ góc quay camera
-• 🎯 **Better QR Detection** - QR code ở bất kỳ vị trí nào đều được detect
-• 📏 **True Aspect Ratio** - Không bị méo hình do crop
-• 🔍 **Enhanced Visibility** - Thấy rõ context xung quanh QR code
-• 📱 **Professional View** - Giao diện chuyên nghiệp như camera monitor
-
-🔍 **ADVANCED SEARCH DATABASE v{self.config.VERSION}**:
-• 🗄️ **Comprehensive Search** - Tìm kiếm theo tên, CCCD, CMND, ngày tháng
-• 📊 **Database Statistics** - Thống kê tổng quan và phân tích dữ liệu
-• 👁️ **Detailed View** - Xem chi tiết từng record với đầy đủ thông tin
-• 🔄 **Smart Duplicate Detection** - Phát hiện và xử lý trùng lặp thông minh
-• 📁 **File Management** - Quản lý file Word, ảnh, JSON tập trung
-• 📋 **Export to CSV** - Xuất dữ liệu ra CSV cho báo cáo
-
-🎯 **FULL FRAME CAMERA WORKFLOW v{self.config.VERSION}**:
-1️⃣ Chọn camera từ dropdown → Camera được nhận diện tự động
-2️⃣ Click 'START CAMERA' → Full frame preview bắt đầu
-3️⃣ Xem toàn bộ khung camera → Không bị crop hay zoom
-4️⃣ Position QR code → QR guidance overlay trên full frame
-5️⃣ Auto-detection QR → Detect QR ở bất kỳ vị trí nào
-6️⃣ System locks QR data → Duplicate check trong database
-7️⃣ Capture FRONT/BACK → Full frame images được lưu
-8️⃣ Save document → Auto-add vào searchable database
-
-💡 **FULL FRAME TIPS**:
-🖼️ Full frame hiển thị toàn bộ góc nhìn camera
-📐 Aspect ratio được bảo toàn hoàn toàn
-🎯 QR code có thể ở bất kỳ vị trí nào trong frame
-🔍 Guidance overlay tối ưu cho full frame view
-📱 Camera selection tự động detect resolution
-⚡ Preview không bị méo hay crop
-🎨 UI tự động scale theo camera resolution
-
-🆕 **NEW FULL FRAME FEATURES v{self.config.VERSION}**:
-🖼️ Complete camera frame display - no cropping
-📐 True aspect ratio preservation
-🎯 Enhanced QR detection area coverage
-📏 Frame size indicator overlay
-⚡ Optimized guidance for full frame
-🎨 Professional camera monitor experience
-
-🔧 **READY TO START**: 
-1. Chọn camera từ dropdown (full frame mode)
-2. Click 'START CAMERA' để xem toàn bộ khung hình
-3. Hoặc 'SEARCH DB' để tìm kiếm!
-
-🎨 **Experience the most advanced full-frame multi-camera CCCD scanner!**"""
+        welcome_text = _WELCOME_TEMPLATE.format_map({
+            'version': self.config.VERSION,
+            'camera_count': camera_count,
+            'camera_list': camera_list,
+        })
         
         self._update_content_log(welcome_text)
     
     def _update_content_log(self, message: str, append: bool = False):
-        """Update system log with auto-scroll"""
+        """Queue a system log update - writes are flushed together at a bounded rate"""
+        self._log_queue.append((message, append))
+        if not self._log_pending:
+            self._log_pending = True
+            self.root.after(self.config.LOG_FLUSH_INTERVAL_MS, self._drain_log)
+    
+    def _drain_log(self):
+        """Apply all queued log updates in one textbox edit and auto-scroll"""
+        self._log_pending = False
         try:
-            if append:
-                current_content = self.content_text.get("0.0", "end-1c")
-                if current_content.strip():
-                    new_content = current_content + "\n" + "─" * 30 + "\n" + message
-                else:
-                    new_content = message
+            # A non-append message replaces everything queued before it
+            replace = False
+            pieces = []
+            while self._log_queue:
+                message, append = self._log_queue.popleft()
+                if not append:
+                    replace = True
+                    pieces.clear()
+                pieces.append(message)
+            
+            separator = "\n" + "─" * 30 + "\n"
+            text = separator.join(pieces)
+            
+            if replace:
+                self.content_text.delete("0.0", "end")
+                self.content_text.insert("0.0", text)
             else:
-                new_content = message
+                # Append at the end without reading the existing content back
+                if self.content_text.index("end-1c") != "1.0":
+                    text = separator + text
+                self.content_text.insert("end", text)
+                
+                # Keep the log bounded over a long session
+                line_count = int(self.content_text.index("end-1c").split(".")[0])
+                if line_count > self.config.LOG_MAX_LINES:
+                    self.content_text.delete("1.0", f"end-{self.config.LOG_MAX_LINES} lines")
             
-            self.content_text.delete("0.0", "end")
-            self.content_text.insert("0.0", new_content)
             self.content_text.see("end")
-            self.root.update_idletasks()
         except Exception as e:
             logger.error(f"Error updating content log: {e}")
     
+    def _post_ui(self, fn, *args):
+        """Queue a call to run on the Tk thread at the next drain - safe from any thread"""
+        self._ui_q.put((fn, args))
+    
+    def _tk_drain(self):
+        """Run all jobs posted by worker threads at ~60 Hz"""
+        # Reschedule first so a job that opens a modal dialog doesn't stall the chain
+        self.root.after(16, self._tk_drain)
+        
+        while True:
+            try:
+                fn, args = self._ui_q.get_nowait()
+            except queue.Empty:
+                break
+            
+            try:
+                fn(*args)
+            except Exception as e:
+                logger.error(f"Error in UI job {getattr(fn, '__name__', fn)}: {e}")
+    
     def _check_complete_status(self):
         """Check if all data is ready for document generation"""
         self.save_buttons.check_complete_status()
     
-    def _video_loop(self):
-        """Video processing loop with QR detection"""
+    def snapshot_current_frame(self) -> Optional[np.ndarray]:
+        """Return a private copy of the latest clean camera frame, or None if there is none"""
+        # The video thread only swaps the reference, so the copy is taken lazily here
+        with self.frame_lock:
+            frame = self.current_frame
+            if frame is None or frame.size == 0:
+                return None
+            return frame.copy()
+    
+    def _start_video_threads(self):
+        """Start the camera producer and the processing consumer threads"""
+        self.stop_video_event.clear()
+        
+        # Drop frames left over from a previous session
+        while True:
+            try:
+                self._frame_q.get_nowait()
+            except queue.Empty:
+                break
+        
+        # The two session-long loops keep dedicated daemon threads rather than pool
+        # workers, so a camera read stuck in the driver can never block interpreter exit
+        self.producer_thread = threading.Thread(target=self._capture_loop, name="scan-capture", daemon=True)
+        self.video_thread = threading.Thread(target=self._video_loop, name="scan-video", daemon=True)
+        self.producer_thread.start()
+        self.video_thread.start()
+    
+    def _join_video_threads(self, timeout: float):
+        """Wait for the producer and consumer threads to finish"""
+        for thread in (self.producer_thread, self.video_thread):
+            if thread and thread.is_alive() and thread is not threading.current_thread():
+                thread.join(timeout=timeout)
+                if thread.is_alive():
+                    logger.warning(f"Video thread did not exit within {timeout}s")
+    
+    def _capture_loop(self):
+        """Camera producer - reads frames at up to MAX_FPS, keeping the newest in a bounded queue"""
         frame_error_count = 0
         max_frame_errors = 10
+        frame_interval = 1.0 / self.config.MAX_FPS
+        next_read = time.monotonic()
         
         while self.scanning and not self.stop_video_event.is_set():
+            # Pace reads to the display budget; waiting on the stop event keeps shutdown prompt
+            delay = next_read - time.monotonic()
+            if delay > 0 and self.stop_video_event.wait(delay):
+                break
+            next_read = max(next_read + frame_interval, time.monotonic())
+            
             frame = self.camera_manager.read_frame()
             if frame is None:
                 frame_error_count += 1
                 if frame_error_count > max_frame_errors:
-                    self.root.after(0, self._handle_video_stream_error)
+                    self._post_ui(self._handle_video_stream_error)
                     break
                 continue
             
             frame_error_count = 0
-            self.current_frame = frame.copy()
-            display_frame = frame.copy()
+            
+            # Drop the oldest frame when the consumer falls behind
+            try:
+                self._frame_q.put_nowait(frame)
+            except queue.Full:
+                try:
+                    self._frame_q.get_nowait()
+                except queue.Empty:
+                    pass
+                self._frame_q.put_nowait(frame)
+    
+    def _video_loop(self):
+        """Video processing loop with QR detection, fed by _capture_loop"""
+        # Bind the per-frame lookups once; only scanning/qr_locked are re-read each frame
+        get_frame = self._frame_q.get
+        stop_set = self.stop_video_event.is_set
+        frame_lock = self.frame_lock
+        qr_lock = self.qr_lock
+        detected = self.detected_qrs
+        get_locked_overlay = self._get_locked_overlay
+        draw_overlay = self.qr_processor.draw_guidance_overlay
+        detect = self.qr_processor.detect_qr_codes
+        draw = self.qr_processor.draw_detection
+        update_disp = self.camera_panel_handler.update_video_display
+        post_ui = self._post_ui
+        process_qr = self._process_qr_data
+        cvt_color, resize, absdiff = cv2.cvtColor, cv2.resize, cv2.absdiff
+        monotonic = time.monotonic
+        detect_every = self.config.QR_DETECTION_EVERY_N_FRAMES
+        motion_threshold = self.config.QR_MOTION_THRESHOLD
+        rescan_interval = self.config.QR_RESCAN_INTERVAL
+        max_dim = self.config.QR_DETECTION_MAX_DIM
+        history_size = self.config.QR_HISTORY_SIZE
+        
+        # QR detection gating: frame counter, last scanned thumbnail and its results
+        frame_counter = 0
+        prev_small: Optional[np.ndarray] = None
+        last_scan_time = 0.0
+        last_barcodes = []
+        
+        # RGB display buffer reused across frames; the panel reads it synchronously
+        # (it is resized into a new image before update_video_display returns)
+        display_buf: Optional[np.ndarray] = None
+        
+        while self.scanning and not stop_set():
+            try:
+                frame = get_frame(timeout=0.5)
+            except queue.Empty:
+                continue
+            
+            # read_frame hands out a fresh array, so it is published by reference
+            # for snapshot_current_frame - only the capture path copies it
+            with frame_lock:
+                self.current_frame = frame
+            
+            # The BGR->RGB conversion the display needs anyway yields the buffer the
+            # overlays are drawn on, so the camera frame is never copied or modified.
+            # It is written into the persistent buffer, reallocated only on a size change
+            if display_buf is None or display_buf.shape != frame.shape:
+                display_buf = np.empty_like(frame)
+                # Render the locked indicator for this size now rather than on the
+                # first frame after a QR locks
+                get_locked_overlay(frame.shape)
+            display_frame = cvt_color(frame, cv2.COLOR_BGR2RGB, dst=display_buf)
+            
+            if self.qr_locked:
+                # Locked: no guidance or detection, only the cached indicator
+                roi, overlay, mask = get_locked_overlay(display_frame.shape)
+                np.copyto(display_frame[roi], overlay, where=mask)
+                update_disp(display_frame)
+                continue
+            
+            # One luma conversion shared by the guidance overlay and the detector
+            gray = cvt_color(frame, cv2.COLOR_BGR2GRAY)
             
             # Apply guidance overlay
-            display_frame = self.qr_processor.draw_guidance_overlay(display_frame)
+            display_frame = draw_overlay(display_frame, gray, rgb=True)
             
-            # QR detection - only if not locked
-            if not self.qr_locked:
-                barcodes = self.qr_processor.detect_qr_codes(frame)
-                for barcode in barcodes:
-                    display_frame = self.qr_processor.draw_detection(display_frame, barcode)
-                    
-                    try:
-                        barcode_data = barcode.data.decode('utf-8')
-                        if barcode_data not in self.detected_qrs:
-                            self.detected_qrs.add(barcode_data)
-                            self.root.after(0, self._process_qr_data, barcode_data)
-                    except UnicodeDecodeError:
-                        logger.warning("Failed to decode QR data")
+            # QR detection only on every Nth frame and only when the scene moved since
+            # the last scan; a still scene is re-scanned periodically in case it was missed
+            barcodes = []
+            frame_counter += 1
+            if frame_counter % detect_every == 0:
+                small = resize(gray, (80, 45), interpolation=cv2.INTER_AREA)
+                now = monotonic()
+                if (prev_small is None
+                        or now - last_scan_time >= rescan_interval
+                        or np.mean(absdiff(small, prev_small)) >= motion_threshold):
+                    prev_small = small
+                    last_scan_time = now
+                    barcodes = detect(gray, max_dim)
+                    last_barcodes = barcodes
+            
+            # Skipped frames keep showing the boxes from the last scan
+            for barcode in last_barcodes:
+                display_frame = draw(display_frame, barcode, rgb=True)
+            
+            for barcode in barcodes:
+                # Check the raw bytes first so a QR held in view is decoded only once
+                # (keyed by the payload hash - an int compare instead of a long bytes compare)
+                raw_data = barcode.data
+                key = hash(raw_data)
+                with qr_lock:
+                    if key in detected:
+                        detected.move_to_end(key)
+                        continue
+                    detected[key] = None
+                    if len(detected) > history_size:
+                        detected.popitem(last=False)
+                
+                # Decode only on first sight; the dispatch stays outside the try
+                try:
+                    barcode_data = raw_data.decode('utf-8')
+                except UnicodeDecodeError:
+                    logger.warning("Failed to decode QR data")
+                    continue
+                post_ui(process_qr, barcode_data)
+            
+            update_disp(display_frame)
+    
+    def _get_locked_overlay(self, shape):
+        """Render the QR locked indicator (RGB) once per frame size and return (roi, overlay, mask)"""
+        if self._locked_overlay is None or self._locked_overlay[0] != shape:
+            # Hard-edged text (LINE_8) so no dim antialiased pixels get pasted by the mask
+            canvas = np.zeros(shape, dtype=np.uint8)
+            cv2.putText(canvas, "QR LOCKED - Du lieu da duoc giu", (20, 90), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2, lineType=cv2.LINE_8)
+            cv2.putText(canvas, "Nhan 'QUET LAI QR' de quet moi", (20, 120), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2, lineType=cv2.LINE_8)
+            
+            # Keep only the bounding box of the text so blitting touches few pixels
+            mask = canvas.any(axis=2)
+            ys, xs = np.nonzero(mask)
+            if ys.size:
+                roi = (slice(ys.min(), ys.max() + 1), slice(xs.min(), xs.max() + 1))
             else:
-                # Show QR locked indicator
-                import cv2
-                cv2.putText(display_frame, "QR LOCKED - Du lieu da duoc giu", (20, 90), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-                cv2.putText(display_frame, "Nhan 'QUET LAI QR' de quet moi", (20, 120), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
+                roi = (slice(0, 0), slice(0, 0))
             
-            self.camera_panel_handler.update_video_display(display_frame)
+            self._locked_overlay = (shape, roi, canvas[roi].copy(), mask[roi][..., None])
+        
+        return self._locked_overlay[1:]
     
     def _handle_video_stream_error(self):
         """Handle video stream errors"""
@@ -542,17 +795,52 @@ class VietnameseIDScannerGUI:
             self.root.after(1000, self.camera_buttons.start_scanning)
     
     def _process_qr_data(self, qr_content: str):
-        """Process detected QR data with duplicate check"""
+        """Process detected QR data - parsing and duplicate check run off the Tk thread"""
+        # Lock before submitting so no other QR is dispatched while this one is in flight
+        if self.qr_locked:
+            return
+        self.qr_locked = True
+        self._io_pool.submit(self._parse_and_check, qr_content, self._qr_generation)
+    
+    def _parse_and_check(self, qr_content: str, generation: int):
+        """Worker: parse QR content and check for an existing record, then post back to Tk"""
         try:
             id_info = self.id_parser.parse(qr_content)
-            self.current_id_info = id_info
-            
-            # Check for existing person
             exists, existing_files = FileManager.check_existing_person(id_info)
+        except Exception as e:
+            logger.error(f"Error processing QR data: {e}")
+            self._post_ui(self._report_qr_error, e, generation)
+            return
+        
+        self._post_ui(self._apply_qr_result, qr_content, id_info, exists, existing_files, generation)
+    
+    def _report_qr_error(self, error: Exception, generation: Optional[int] = None):
+        """Log a QR processing error to the activity log and release the QR lock"""
+        # A Reset/Rescan since the lookup was submitted already released the lock
+        if generation is not None and generation != self._qr_generation:
+            return
+        self.qr_locked = False
+        
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        error_message = f"❌ [{timestamp}] Lỗi xử lý QR code: {str(error)}"
+        self._update_content_log(error_message, append=True)
+    
+    def _apply_qr_result(self, qr_content: str, id_info: Dict[str, str],
+                         exists: bool, existing_files: List[Dict[str, str]], generation: int):
+        """Apply a parsed QR result on the Tk thread - duplicate dialog, data panel and log"""
+        # Drop results for a QR that Reset/Rescan discarded while it was being looked up
+        if generation != self._qr_generation:
+            return
+        
+        # One timestamp for every log line of this scan event
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        
+        try:
+            self.current_id_info = id_info
+            self.current_qr_content = qr_content
             
             if exists:
                 # Show duplicate dialog
-                timestamp = datetime.now().strftime("%H:%M:%S")
                 log_text = f"⚠️ [{timestamp}] Phát hiện thông tin người này đã có trong database!\n"
                 log_text += f"👤 Họ tên: {id_info.get('Họ và tên', 'N/A')}\n"
                 log_text += f"🆔 Số CCCD: {id_info.get('Số CCCD', 'N/A')}\n"
@@ -566,24 +854,27 @@ class VietnameseIDScannerGUI:
                     dialog = DuplicateCheckDialog(self.root, id_info, existing_files)
                     self.root.wait_window(dialog)
                     
+                    # Reset/Rescan may have run while the dialog was open
+                    if generation != self._qr_generation:
+                        return
+                    
                     # Process user choice
                     if dialog.result == 'cancel':
                         self.qr_locked = False
-                        self.detected_qrs.clear()
+                        with self.qr_lock:
+                            self.detected_qrs.clear()
                         self.current_id_info = None
+                        self.current_qr_content = None
                         
-                        timestamp = datetime.now().strftime("%H:%M:%S")
                         message = f"❌ [{timestamp}] Đã hủy bỏ - Sẵn sàng quét QR mới"
                         self._update_content_log(message, append=True)
                         return
                     elif dialog.result == 'overwrite':
                         self._existing_file_to_overwrite = existing_files[0]
-                        timestamp = datetime.now().strftime("%H:%M:%S")
                         message = f"🔄 [{timestamp}] Đã chọn LƯU ĐÈ - File cũ sẽ bị thay thế khi lưu"
                         self._update_content_log(message, append=True)
                     else:  # 'new'
                         self._existing_file_to_overwrite = None
-                        timestamp = datetime.now().strftime("%H:%M:%S")
                         message = f"➕ [{timestamp}] Đã chọn TẠO MỚI - File mới sẽ được tạo riêng"
                         self._update_content_log(message, append=True)
                 except ImportError:
@@ -594,20 +885,14 @@ class VietnameseIDScannerGUI:
             else:
                 self._existing_file_to_overwrite = None
             
-            # Lock QR detection after successful scan
-            self.qr_locked = True
-            
-            # Update data display
-            for field, value in id_info.items():
-                if field in self.data_labels:
-                    self.data_labels[field].configure(text=value)
+            # Update data display in one batch on the next idle
+            self.root.after_idle(self._apply_id_info, id_info)
             
             # Enable rescan button
             if self.rescan_btn:
                 self.rescan_btn.configure(state="normal")
             
             # Update log
-            timestamp = datetime.now().strftime("%H:%M:%S")
             camera_info = self.camera_manager.get_current_camera_info()
             log_text = f"🎉 [{timestamp}] QR Code được nhận diện thành công từ {camera_info}!\n\n"
             log_text += f"👤 Họ tên: {id_info.get('Họ và tên', 'N/A')}\n"
@@ -628,10 +913,23 @@ class VietnameseIDScannerGUI:
             
         except Exception as e:
             logger.error(f"Error processing QR data: {e}")
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            error_message = f"❌ [{timestamp}] Lỗi xử lý QR code: {str(e)}"
-            self._update_content_log(error_message, append=True)
+            self._report_qr_error(e)
 
+    def _apply_id_info(self, id_info: Dict[str, str]):
+        """Show parsed ID fields in the data panel in a single pass"""
+        # Walk the prebuilt (field, label) plan rather than every parsed field,
+        # and skip the Tcl configure call for labels already showing the value
+        label_texts = self._label_texts
+        for field, label in self._label_update_plan:
+            value = id_info.get(field)
+            if value is not None and label_texts.get(field) != value:
+                label.configure(text=value)
+                label_texts[field] = value
+    
+    def _clear_id_info(self):
+        """Reset the data panel labels to the empty placeholder"""
+        self._apply_id_info(dict.fromkeys(self.data_labels, "Chưa có dữ liệu"))
+    
     def _check_expiry_warning(self, id_info: Dict[str, str]):
         """Kiểm tra và hiển thị cảnh báo hết hạn"""
         expiry_date_str = id_info.get("Ngày đến hạn CCCD", "")
@@ -640,7 +938,7 @@ class VietnameseIDScannerGUI:
             try:
                 from datetime import timedelta
                 
-                expiry_date = datetime.strptime(expiry_date_str, "%d/%m/%Y")
+                expiry_date = IDDataParser.parse_date(expiry_date_str)
                 current_date = datetime.now()
                 days_until_expiry = (expiry_date - current_date).days
                 
@@ -660,6 +958,9 @@ class VietnameseIDScannerGUI:
         """Run the application"""
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
         
+        # Start draining jobs posted by the video and worker threads
+        self._tk_drain()
+        
         try:
             self.root.mainloop()
         finally:
@@ -673,11 +974,20 @@ class VietnameseIDScannerGUI:
         self.root.destroy()
     
     def _cleanup(self):
-        """Cleanup resources"""
+        """Cleanup resources - runs at most once"""
+        if self._cleaned:
+            return
+        self._cleaned = True
+        
         try:
-            self.camera_manager.stop()
-            if self.video_thread and self.video_thread.is_alive():
-                self.stop_video_event.set()
-                self.video_thread.join(timeout=2.0)
+            # Signal the loops first so neither starts another read, then release the
+            # device (unblocking a pending read) before waiting for them
+            self.scanning = False
+            self.stop_video_event.set()
+            try:
+                self.camera_manager.stop()
+            finally:
+                self._join_video_threads(timeout=2.0)
+            self._io_pool.shutdown(wait=False)
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
\ No newline at end of file
@@ -2,15 +2,95 @@ import customtkinter as ctk
 from PIL import Image
 import cv2
 import numpy as np
+import functools
+import time
+from typing import Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Preview resampling filters - INTER_AREA is a box filter for shrinking, INTER_LINEAR is
+# bilinear for enlarging; both are far cheaper than Lanczos and look the same at preview size
+PREVIEW_DOWNSCALE_INTERPOLATION = cv2.INTER_AREA
+PREVIEW_UPSCALE_INTERPOLATION = cv2.INTER_LINEAR
+
+@functools.lru_cache(maxsize=64)
+def _fit_size(orig_w: int, orig_h: int, panel_w: int, panel_h: int,
+              padding: int = 0, min_w: int = 0, min_h: int = 0) -> Tuple[int, int]:
+    """Largest aspect-preserving size inside the padded panel, grown to the minimum if smaller"""
+    aspect_ratio = orig_w / orig_h
+    
+    # Calculate available space with padding
+    available_width = panel_w - (padding * 2)
+    available_height = panel_h - (padding * 2)
+    
+    # Calculate new size while maintaining aspect ratio
+    # Fit the entire frame within the panel
+    if aspect_ratio > available_width / available_height:
+        # Frame is wider - fit to width
+        new_width = available_width
+        new_height = int(available_width / aspect_ratio)
+    else:
+        # Frame is taller - fit to height
+        new_height = available_height
+        new_width = int(available_height * aspect_ratio)
+    
+    # Apply minimum size if calculated size is too small
+    if new_width < min_w or new_height < min_h:
+        if aspect_ratio > min_w / min_h:
+            new_width = min_w
+            new_height = int(min_w / aspect_ratio)
+        else:
+            new_height = min_h
+            new_width = int(min_h * aspect_ratio)
+    
+    # Ensure we don't exceed panel bounds
+    return min(new_width, available_width), min(new_height, available_height)
+
+
 class CameraPanel:
     """Camera display panel with camera selection and full frame preview"""
     
     def __init__(self, main_app):
         self.app = main_app
+        self._resized_buf: Optional[np.ndarray] = None  # Preview-sized resize target, reused per frame
+        self._rgba_buf: Optional[np.ndarray] = None     # Preview-sized RGBA image backing the Tk image
+        self._ctk_image: Optional[ctk.CTkImage] = None  # Image currently shown by the camera label
+        
+        # Display throttling: last accepted frame time and whether Tk still owes a redraw
+        self._last_display_ts = 0.0
+        # (10% slack so capture jitter at the same rate doesn't drop every other frame)
+        self._min_display_interval = 0.9 / self.app.config.DISPLAY_MAX_FPS
+        self._display_pending = False
+        self._layout_warned = False    # One-shot warning for frames needing a layout fix
+        
+        # Widget sizes cached from <Configure> so the video thread never crosses into Tcl
+        self._cached_panel_size = (0, 0)
+        self._cached_window_width = 0
+        logger.info(
+            f"Preview resampling: downscale={PREVIEW_DOWNSCALE_INTERPOLATION}, "
+            f"upscale={PREVIEW_UPSCALE_INTERPOLATION}"
+        )
+        
+        # Optional GPU upload buffer for the preview resize (None = CPU path)
+        self._gpu_src = None
+        if self.app.config.PREVIEW_USE_CUDA:
+            try:
+                if cv2.cuda.getCudaEnabledDeviceCount() > 0:
+                    self._gpu_src = cv2.cuda_GpuMat()
+                    logger.info("Preview resizing on CUDA")
+                else:
+                    logger.info("No CUDA device available - preview resizing on CPU")
+            except (AttributeError, cv2.error) as e:
+                logger.info(f"OpenCV built without CUDA - preview resizing on CPU: {e}")
+        
+        # Optional OpenCL (Transparent API) pipeline for resize + RGBA conversion
+        self._use_opencl = False
+        if self.app.config.PREVIEW_USE_OPENCL and self._gpu_src is None:
+            # OpenCL itself is only switched on around the preview conversion, so QR
+            # preprocessing elsewhere keeps OpenCV's default setting
+            self._use_opencl = cv2.ocl.haveOpenCL()
+            logger.info(f"Preview OpenCL pipeline: {'on' if self._use_opencl else 'unavailable'}")
     
     def create_camera_panel(self, parent):
         """Create the adaptive camera panel with camera selection"""
@@ -64,10 +144,21 @@ class CameraPanel:
             text_color="#FFFFFF"
         )
         self.app.cam_panel.grid(row=1, column=0, sticky="nsew", padx=10, pady=0)
+        self.app.cam_panel.bind('<Configure>', self._on_panel_configure, add="+")
+        self.app.root.bind('<Configure>', self._on_root_configure, add="+")
         
         # Camera controls (now includes camera selection)
         self.app.camera_buttons.create_camera_controls(self.app.camera_panel)
     
+    def _on_panel_configure(self, event=None):
+        """Remember the camera label's size for the preview fit"""
+        self._cached_panel_size = (self.app.cam_panel.winfo_width(), self.app.cam_panel.winfo_height())
+    
+    def _on_root_configure(self, event):
+        """Remember the window width for the fallback preview size"""
+        if event.widget == self.app.root:
+            self._cached_window_width = event.width
+    
     def update_camera_status_with_info(self, status: str, camera_info: str = ""):
         """Update camera status with current camera information"""
         if camera_info:
@@ -77,112 +168,159 @@ class CameraPanel:
         self.app.camera_status.configure(text=status_text)
     
     def update_video_display(self, display_frame: np.ndarray):
-        """Update video display with full frame - no cropping"""
+        """Update video display with an RGB full frame - no cropping (video thread; Tk only swaps the image)"""
+        # Drop the frame if Tk hasn't shown the previous one yet or it comes too soon
+        now = time.monotonic()
+        if self._display_pending or now - self._last_display_ts < self._min_display_interval:
+            return
+        self._last_display_ts = now
+        
+        # OpenCV's SIMD kernels need contiguous uint8 HxWx3 data - anything else falls
+        # back to slow paths, so such frames are normalized before any resize work
+        if (display_frame.dtype != np.uint8 or display_frame.ndim != 3
+                or display_frame.shape[2] != 3 or not display_frame.flags['C_CONTIGUOUS']):
+            display_frame = self._normalize_frame(display_frame)
+        
         try:
-            # Get current camera panel size
-            panel_width = self.app.cam_panel.winfo_width()
-            panel_height = self.app.cam_panel.winfo_height()
+            # Current camera panel size, as last reported by <Configure>
+            panel_width, panel_height = self._cached_panel_size
             
-            # Only resize if we have valid dimensions
+            # Get original frame dimensions straight from the array
+            original_height, original_width = display_frame.shape[:2]
+            
+            # Only fit to the panel if we have valid dimensions; the fit is memoized, so a
+            # fixed camera and window cost no arithmetic per frame
             if panel_width > 100 and panel_height > 100:
-                cv2image = cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB)
-                img = Image.fromarray(cv2image)
-                
-                # Get original frame dimensions
-                original_width, original_height = img.size
-                aspect_ratio = original_width / original_height
-                
-                # Calculate available space with minimal padding for full frame view
-                padding = 10  # Minimal padding to see frame borders
-                available_width = panel_width - (padding * 2)
-                available_height = panel_height - (padding * 2)
-                
-                # Calculate new size while maintaining aspect ratio
-                # Fit the entire frame within the panel
-                if aspect_ratio > available_width / available_height:
-                    # Frame is wider - fit to width
-                    new_width = available_width
-                    new_height = int(available_width / aspect_ratio)
-                else:
-                    # Frame is taller - fit to height
-                    new_height = available_height
-                    new_width = int(available_height * aspect_ratio)
-                
-                # Ensure minimum readable size
-                min_width = max(320, int(panel_width * 0.6))
-                min_height = max(240, int(panel_height * 0.6))
-                
-                # Apply minimum size if calculated size is too small
-                if new_width < min_width or new_height < min_height:
-                    if aspect_ratio > min_width / min_height:
-                        new_width = min_width
-                        new_height = int(min_width / aspect_ratio)
-                    else:
-                        new_height = min_height
-                        new_width = int(min_height * aspect_ratio)
-                
-                # Ensure we don't exceed panel bounds
-                new_width = min(new_width, available_width)
-                new_height = min(new_height, available_height)
-                
-                # Resize image using high-quality resampling
-                img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                
-                # Create CTk image
-                ctk_image = ctk.CTkImage(
-                    light_image=img_resized,
-                    dark_image=img_resized,
-                    size=(new_width, new_height)
+                # Minimal padding to see frame borders, and a minimum readable size
+                new_width, new_height = _fit_size(
+                    original_width, original_height, panel_width, panel_height, 10,
+                    max(320, int(panel_width * 0.6)), max(240, int(panel_height * 0.6))
                 )
-                
-                self.app.root.after(0, self._update_camera_label, ctk_image)
-                
             else:
-                # Fallback with responsive default sizes
-                window_width = self.app.root.winfo_width()
-                
-                # Adaptive default sizes based on window size
-                if window_width < 1600:
-                    default_size = (480, 360)  # 4:3 ratio
-                elif window_width < 2000:
-                    default_size = (640, 480)  # 4:3 ratio
-                else:
-                    default_size = (800, 600)  # 4:3 ratio
-                
-                cv2image = cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB)
-                img = Image.fromarray(cv2image)
-                
-                # Maintain aspect ratio for fallback
-                original_width, original_height = img.size
-                aspect_ratio = original_width / original_height
-                target_width, target_height = default_size
-                
-                if aspect_ratio > target_width / target_height:
-                    # Wider frame
-                    new_width = target_width
-                    new_height = int(target_width / aspect_ratio)
-                else:
-                    # Taller frame
-                    new_height = target_height
-                    new_width = int(target_height * aspect_ratio)
-                
-                img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                
-                ctk_image = ctk.CTkImage(
-                    light_image=img_resized,
-                    dark_image=img_resized,
-                    size=(new_width, new_height)
+                new_width, new_height = _fit_size(
+                    original_width, original_height, *self._fallback_size()
                 )
-                
-                self.app.root.after(0, self._update_camera_label, ctk_image)
+            
+            # Resize with OpenCV (SIMD) and wrap only the small result for Tk
+            if self._use_opencl:
+                img_resized = self._prepare_opencl(display_frame, new_width, new_height)
+            else:
+                img_resized = self._to_pil_rgba(
+                    self._resize_frame(display_frame, new_width, new_height)
+                )
+            
+            self._display_pending = True
+            self.app._post_ui(self._update_camera_label, img_resized)
                 
         except Exception as e:
             logger.error(f"Error updating video display: {e}")
     
-    def _update_camera_label(self, ctk_image):
-        """Thread-safe camera label update"""
-        if self.app.cam_panel and self.app.scanning:
-            self.app.cam_panel.configure(image=ctk_image, text="")
+    def _normalize_frame(self, frame: np.ndarray) -> np.ndarray:
+        """Convert a frame to contiguous uint8 RGB, warning once so the producer can be fixed"""
+        if not self._layout_warned:
+            self._layout_warned = True
+            logger.warning(
+                f"Display frame needs conversion (dtype={frame.dtype}, shape={frame.shape}, "
+                f"contiguous={frame.flags['C_CONTIGUOUS']})"
+            )
+        
+        if frame.dtype != np.uint8:
+            frame = np.clip(frame, 0, 255).astype(np.uint8)
+        if frame.ndim == 3 and frame.shape[2] == 1:
+            frame = frame[:, :, 0]
+        if frame.ndim == 2:
+            frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2RGB)
+        elif frame.shape[2] == 4:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+        return np.ascontiguousarray(frame)
+    
+    def _fallback_size(self) -> Tuple[int, int]:
+        """Default display box while the panel has no usable size yet"""
+        # Fallback with responsive default sizes
+        window_width = self._cached_window_width
+        
+        # Adaptive default sizes based on window size
+        if window_width < 1600:
+            return (480, 360)  # 4:3 ratio
+        elif window_width < 2000:
+            return (640, 480)  # 4:3 ratio
+        else:
+            return (800, 600)  # 4:3 ratio
+    
+    def _resize_frame(self, frame: np.ndarray, width: int, height: int) -> np.ndarray:
+        """Resize a frame for preview into a reused buffer (area filter shrinking, linear enlarging)"""
+        shape = (height, width) + frame.shape[2:]
+        if self._resized_buf is None or self._resized_buf.shape != shape:
+            self._resized_buf = np.empty(shape, dtype=frame.dtype)
+        
+        interpolation = self._interpolation(frame, width)
+        
+        if self._gpu_src is not None:
+            try:
+                self._gpu_src.upload(frame)
+                gpu_resized = cv2.cuda.resize(self._gpu_src, (width, height), interpolation=interpolation)
+                return gpu_resized.download(self._resized_buf)
+            except cv2.error as e:
+                # Fall back to the CPU for the rest of the session
+                logger.warning(f"CUDA preview resize failed, using CPU: {e}")
+                self._gpu_src = None
+        
+        return cv2.resize(frame, (width, height), dst=self._resized_buf, interpolation=interpolation)
+    
+    @staticmethod
+    def _interpolation(frame: np.ndarray, width: int) -> int:
+        """Resampling filter for resizing frame to the given width"""
+        if width < frame.shape[1]:
+            return PREVIEW_DOWNSCALE_INTERPOLATION
+        return PREVIEW_UPSCALE_INTERPOLATION
+    
+    def _prepare_opencl(self, frame: np.ndarray, width: int, height: int) -> Image.Image:
+        """Resize and expand to RGBA on the OpenCL device, downloading only the result"""
+        previous_use = cv2.ocl.useOpenCL()
+        cv2.ocl.setUseOpenCL(True)
+        try:
+            umat = cv2.resize(cv2.UMat(frame), (width, height), interpolation=self._interpolation(frame, width))
+            rgba = cv2.cvtColor(umat, cv2.COLOR_RGB2RGBA).get()
+        except cv2.error as e:
+            # Fall back to the CPU for the rest of the session
+            logger.warning(f"OpenCL preview pipeline failed, using CPU: {e}")
+            self._use_opencl = False
+            return self._to_pil_rgba(self._resize_frame(frame, width, height))
+        finally:
+            # Leave the rest of the video thread's OpenCV calls on their own setting
+            cv2.ocl.setUseOpenCL(previous_use)
+        
+        # get() returns a fresh array per frame, so it can be wrapped without copying
+        return Image.frombuffer("RGBA", (width, height), rgba, "raw", "RGBA", 0, 1)
+    
+    def _to_pil_rgba(self, rgb: np.ndarray) -> Image.Image:
+        """Expand a preview frame to RGBA in a reused buffer and wrap it without copying"""
+        # Pillow stores RGB as 4 bytes per pixel, so fromarray on RGB always copies row by
+        # row; RGBA produced by OpenCV can be wrapped in place. Reusing the buffer is safe
+        # because a new frame is only prepared after Tk has rendered the previous one
+        height, width = rgb.shape[:2]
+        if self._rgba_buf is None or self._rgba_buf.shape[:2] != (height, width):
+            self._rgba_buf = np.empty((height, width, 4), dtype=np.uint8)
+        cv2.cvtColor(rgb, cv2.COLOR_RGB2RGBA, dst=self._rgba_buf)
+        return Image.frombuffer("RGBA", (width, height), self._rgba_buf, "raw", "RGBA", 0, 1)
+    
+    def _update_camera_label(self, image: Image.Image):
+        """Thread-safe camera label update - reuses the label's CTkImage across frames"""
+        try:
+            if self.app.cam_panel and self.app.scanning:
+                # The app always runs in dark mode, so only the dark image is set
+                # (CTkImage falls back to it in light mode)
+                ctk_image = self._ctk_image
+                if ctk_image is not None and self.app.cam_panel.cget("image") is ctk_image:
+                    # Swapping the source image and size notifies the label through its
+                    # configure callback - no new wrapper even when the panel is resized
+                    ctk_image.configure(dark_image=image, size=image.size)
+                else:
+                    self._ctk_image = ctk.CTkImage(dark_image=image, size=image.size)
+                    self.app.cam_panel.configure(image=self._ctk_image, text="")
+        finally:
+            # Only now is the frame's buffer free to be reused - the PhotoImage has been built
+            self._display_pending = False
     
     def get_display_info(self):
         """Get current display information for debugging"""
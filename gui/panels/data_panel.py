@@ -56,35 +56,38 @@ class DataPanel:
             "Giới tính", "Địa chỉ", "Ngày cấp CCCD", "Ngày đến hạn CCCD" 
         ]
         
+        # Each field is a header/value label pair gridded straight into the scroll area;
+        # the shared background stands in for a per-field container frame
+        data_scroll.grid_columnconfigure(0, weight=1)
+        
         self.app.data_labels = {}
-        for field in fields:
-            field_container = ctk.CTkFrame(data_scroll, fg_color="#333333")
-            field_container.pack(fill="x", pady=2)
-            
-            # Configure responsive grid
-            field_container.grid_rowconfigure(0, weight=1)
-            field_container.grid_rowconfigure(1, weight=1)
-            field_container.grid_columnconfigure(0, weight=1)
-            
+        for index, field in enumerate(fields):
             # Field label with special color for expiry date
             label_color = "#FF6666" if field == "Ngày đến hạn CCCD" else "#00DDDD"
             label = ctk.CTkLabel(
-                field_container,
+                data_scroll,
                 text=field,
                 font=("Arial", 10, "bold"),
                 text_color=label_color,
-                anchor="w"
+                fg_color="#333333",
+                corner_radius=0,
+                anchor="w",
+                padx=10
             )
-            label.grid(row=0, column=0, sticky="ew", padx=10, pady=2)
+            label.grid(row=index * 2, column=0, sticky="ew", pady=(2, 0))
             
             # Field value
             value_label = ctk.CTkLabel(
-                field_container,
+                data_scroll,
                 text="Chưa có dữ liệu",
                 font=("Arial", 11),
                 text_color="#FFFFFF",
-                anchor="w"
+                fg_color="#333333",
+                corner_radius=0,
+                anchor="w",
+                padx=10,
+                pady=2
             )
-            value_label.grid(row=1, column=0, sticky="ew", padx=10, pady=(0, 5))
+            value_label.grid(row=index * 2 + 1, column=0, sticky="ew", pady=(0, 2))
             
             self.app.data_labels[field] = value_label
\ No newline at end of file
@@ -8,6 +8,8 @@ class LogPanel:
     
     def __init__(self, main_app):
         self.app = main_app
+        self._log_font_size = 9        # Font size currently applied to the log textbox
+        self._font_after_id = None     # Pending debounced font adjustment
     
     def create_log_panel(self, parent):
         """Create adaptive activity log panel"""
@@ -49,10 +51,17 @@ class LogPanel:
         self.app.content_text.grid(row=1, column=0, sticky="nsew", padx=10, pady=(0, 10))
         
         # Bind text widget to auto-adjust font size based on panel width
-        self.app.content_text.bind('<Configure>', self._adjust_log_font)
+        self.app.content_text.bind('<Configure>', self._schedule_log_font)
+    
+    def _schedule_log_font(self, event=None):
+        """Debounce Configure events so a drag resize adjusts the font once"""
+        if self._font_after_id is not None:
+            self.app.root.after_cancel(self._font_after_id)
+        self._font_after_id = self.app.root.after(50, self._adjust_log_font)
     
     def _adjust_log_font(self, event=None):
         """Adjust log font size based on panel width"""
+        self._font_after_id = None
         try:
             if hasattr(self.app, 'log_panel'):
                 panel_width = self.app.log_panel.winfo_width()
@@ -67,11 +76,10 @@ class LogPanel:
                 else:
                     font_size = 11
                 
-                # Update font if changed
-                current_font = self.app.content_text.cget("font")
-                if isinstance(current_font, tuple) and len(current_font) >= 2:
-                    if current_font[1] != font_size:
-                        self.app.content_text.configure(font=("Consolas", font_size))
+                # Update font only when the size bucket changed - no cget round-trip
+                if font_size != self._log_font_size:
+                    self._log_font_size = font_size
+                    self.app.content_text.configure(font=("Consolas", font_size))
                         
         except Exception as e:
             logger.error(f"Error adjusting log font: {e}")
\ No newline at end of file
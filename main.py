@@ -16,9 +16,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def show_startup_message():
-    """Display startup banner with search features"""
-    banner = f"""
+# Startup banner, built once at import
+_BANNER = f"""
 ╔{'═' * 80}╗
 ║{' ' * 80}║
 ║{'🆔 AGRIBANK ID SCANNER + ADVANCED SEARCH DATABASE'.center(80)}║
@@ -44,7 +43,26 @@ def show_startup_message():
 ║{' ' * 80}║
 ╚{'═' * 80}╝
 """
-    print(banner)
+
+
+def show_startup_message():
+    """Display startup banner with search features"""
+    print(_BANNER)
+
+
+def configure_opencv():
+    """Enable OpenCV's optimized (SIMD) code paths and log the JPEG codec it was built with"""
+    import cv2
+    
+    cv2.setUseOptimized(True)
+    cv2.setNumThreads(max(1, (os.cpu_count() or 2) // 2))
+    
+    # Snapshots are written with cv2.imwrite - report whether it uses libjpeg-turbo
+    jpeg_info = next(
+        (line.strip() for line in cv2.getBuildInformation().splitlines() if line.strip().startswith("JPEG:")),
+        "JPEG: unknown"
+    )
+    logger.info(f"OpenCV {cv2.__version__} optimized={cv2.useOptimized()} threads={cv2.getNumThreads()} {jpeg_info}")
 
 
 def main():
@@ -58,6 +76,7 @@ def main():
             pass
         
         show_startup_message()
+        configure_opencv()
         
         # Import and create main application
         from gui.main_window import VietnameseIDScannerGUI